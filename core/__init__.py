@@ -2,7 +2,7 @@
 Core module for YouTube Downloader application.
 """
 
-from core.queue import DownloadQueue, DownloadJob, JobStatus
+from core.queue import DownloadQueue, DownloadJob, JobStatus, JobUIState
 from core.conversion_queue import ConversionQueue, ConversionJob, ConversionStatus
 from core.downloader import Downloader
 from core.converter import FileConverter
@@ -12,6 +12,7 @@ __all__ = [
     'DownloadQueue',
     'DownloadJob', 
     'JobStatus',
+    'JobUIState',
     'ConversionQueue',
     'ConversionJob',
     'ConversionStatus',
@@ -1,11 +1,13 @@
 """
 Conversion queue manager for YouTube Downloader application.
-Handles FIFO queue with worker thread for file conversions.
+Handles FIFO queue with worker threads for file conversions.
 """
 
+import os
 import threading
 import queue
 import time
+from functools import cached_property
 from typing import Optional, Callable, List
 from dataclasses import dataclass
 from enum import Enum
@@ -34,67 +36,108 @@ class ConversionJob:
     def __hash__(self):
         """Make ConversionJob hashable based on input_path, target_format, and output_folder."""
         return hash((self.input_path, self.target_format, self.output_folder))
+    
+    @cached_property
+    def display_basename(self) -> str:
+        """File name of the input, computed once per job."""
+        return os.path.basename(self.input_path)
+
+
+class AddResult(Enum):
+    """Outcome of adding a conversion job from the UI."""
+    ADDED = "added"
+    DUPLICATE = "duplicate"  # The same file and format is already waiting
+    REJECTED = "rejected"  # The queue was full or refused the job
 
 
 class ConversionQueue:
     """
-    FIFO queue manager for conversion jobs with worker thread.
+    FIFO queue manager for conversion jobs with a pool of worker threads.
     """
     
-    def __init__(self, conversion_callback: Callable[[ConversionJob], None], max_size: int = 50):
+    def __init__(self, conversion_callback: Callable[[ConversionJob], None], max_size: int = 50,
+                 max_workers: int = 1):
         """
         Initialize the conversion queue.
         
         Args:
             conversion_callback: Function to call when a job should be converted
             max_size: Maximum number of jobs in the queue
+            max_workers: Number of jobs converted at the same time
         """
         self._jobs: List[ConversionJob] = []  # List-based queue for proper removal
         self._conversion_callback = conversion_callback
-        self._worker_thread = None
+        self._max_workers = max(1, max_workers)
+        self._worker_threads: List[threading.Thread] = []
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()  # Pause event
         self._pause_event.set()  # Start paused by default
-        self._current_job: Optional[ConversionJob] = None
+        self._current_jobs: List[ConversionJob] = []  # Jobs being converted right now
         self._lock = threading.Lock()
         self._max_size = max_size
         self._condition = threading.Condition(self._lock)  # For thread synchronization
         
     def start(self):
-        """Start the worker thread."""
-        if self._worker_thread is None or not self._worker_thread.is_alive():
+        """Start the worker threads."""
+        self._worker_threads = [t for t in self._worker_threads if t.is_alive()]
+        if len(self._worker_threads) < self._max_workers:
             self._stop_event.clear()
             self._pause_event.clear()  # Clear pause when starting
-            self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-            self._worker_thread.start()
+            while len(self._worker_threads) < self._max_workers:
+                worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+                worker_thread.start()
+                self._worker_threads.append(worker_thread)
         else:
-            # If thread is already running, just resume it
+            # If threads are already running, just resume them
             self.resume()
     
     def stop(self):
-        """Stop the worker thread."""
+        """Stop the worker threads."""
         self._stop_event.set()
         with self._condition:
-            self._condition.notify_all()  # Wake up worker thread
-        if self._worker_thread and self._worker_thread.is_alive():
-            self._worker_thread.join(timeout=5)
+            self._condition.notify_all()  # Wake up worker threads
+        # One deadline shared by every worker, so closing waits at most 5 seconds in total
+        deadline = time.monotonic() + 5
+        for worker_thread in self._worker_threads:
+            if worker_thread.is_alive():
+                worker_thread.join(timeout=max(0.0, deadline - time.monotonic()))
     
     def pause(self):
-        """Pause the worker thread (it will stop processing new jobs)."""
+        """Pause the worker threads (they will stop processing new jobs)."""
         self._pause_event.set()
         print("[DEBUG] Conversion queue paused")
     
     def resume(self):
-        """Resume the worker thread (it will start processing jobs again)."""
+        """Resume the worker threads (they will start processing jobs again)."""
         self._pause_event.clear()
         with self._condition:
-            self._condition.notify_all()  # Wake up worker thread
+            self._condition.notify_all()  # Wake up worker threads
         print("[DEBUG] Conversion queue resumed")
     
     def is_paused(self) -> bool:
         """Check if the queue is currently paused."""
         return self._pause_event.is_set()
     
+    def pause_if_idle(self, finishing_job: Optional[ConversionJob] = None) -> bool:
+        """
+        Pause the queue if nothing is waiting and no other job is being converted.
+        
+        Checked under the queue lock, so a job added or claimed at the same
+        time keeps the queue running.
+        
+        Args:
+            finishing_job: The job whose worker is asking; it doesn't count as active
+            
+        Returns:
+            True if the queue was paused
+        """
+        with self._lock:
+            if self._jobs or any(current_job is not finishing_job for current_job in self._current_jobs):
+                return False
+            self._pause_event.set()
+        print("[DEBUG] Conversion queue paused")
+        return True
+    
     def add_job(self, job: ConversionJob) -> bool:
         """
         Add a job to the queue.
@@ -109,7 +152,7 @@ class ConversionQueue:
             if len(self._jobs) >= self._max_size:
                 return False
             self._jobs.append(job)
-            self._condition.notify_all()  # Wake up worker thread
+            self._condition.notify_all()  # Wake up worker threads
             return True
     
     def is_queue_full(self) -> bool:
@@ -132,7 +175,7 @@ class ConversionQueue:
             True if job was cancelled
         """
         with self._lock:
-            if self._current_job == job:
+            if job in self._current_jobs:
                 job.status = ConversionStatus.FAILED
                 return True
             
@@ -160,8 +203,8 @@ class ConversionQueue:
                 print(f"[DEBUG] Removed conversion job from queue: {job.title}")
                 return True
             
-            # If it's the current job, mark as failed to stop processing
-            if self._current_job == job:
+            # If it's being converted, mark as failed to stop processing
+            if job in self._current_jobs:
                 job.status = ConversionStatus.FAILED
                 print(f"[DEBUG] Marked current conversion job as failed to stop processing: {job.title}")
                 return True
@@ -175,9 +218,9 @@ class ConversionQueue:
         return False
     
     def get_current_job(self) -> Optional[ConversionJob]:
-        """Get the currently converting job."""
+        """Get the longest-running job currently converting."""
         with self._lock:
-            return self._current_job
+            return self._current_jobs[0] if self._current_jobs else None
     
     def get_queue_size(self) -> int:
         """Get the number of jobs in the queue."""
@@ -210,6 +253,8 @@ class ConversionQueue:
                         for i, queued_job in enumerate(self._jobs):
                             if queued_job.status == ConversionStatus.PENDING:
                                 job = self._jobs.pop(i)
+                                # Claim it while still holding the lock so the job is never in neither list
+                                self._current_jobs.append(job)
                                 break
                         
                         if job is not None:
@@ -221,22 +266,16 @@ class ConversionQueue:
                 if job is None:
                     continue
                 
-                # Set as current job outside the condition block to avoid deadlock
-                with self._lock:
-                    self._current_job = job
-                
                 # Double-check that job is still pending before processing
                 if job.status != ConversionStatus.PENDING:
                     print(f"[DEBUG] Skipping conversion job {job.title} - status is {job.status.value}")
-                    with self._lock:
-                        self._current_job = None
+                    self._clear_current_job(job)
                     continue
                 
                 # Additional check: if job was removed from UI (status changed to FAILED), skip it
                 if job.status == ConversionStatus.FAILED:
                     print(f"[DEBUG] Conversion job was marked as failed after popping, skipping: {job.title}")
-                    with self._lock:
-                        self._current_job = None
+                    self._clear_current_job(job)
                     continue
                 
                 try:
@@ -259,14 +298,21 @@ class ConversionQueue:
                         job.error_message = str(e)
                 
                 finally:
-                    with self._lock:
-                        self._current_job = None
+                    self._clear_current_job(job)
                     
             except Exception as e:
                 # Log error and continue
                 print(f"Conversion worker thread error: {e}")
                 continue
     
+    def _clear_current_job(self, job: ConversionJob):
+        """Forget a job once its worker is done with it."""
+        with self._lock:
+            for i, current_job in enumerate(self._current_jobs):
+                if current_job is job:
+                    del self._current_jobs[i]
+                    break
+    
     def update_job_progress(self, job: ConversionJob, progress: float):
         """
         Update the progress of a job.
@@ -289,4 +335,4 @@ class ConversionQueue:
             True if the job is currently being processed
         """
         with self._lock:
-            return self._current_job == job 
\ No newline at end of file
+            return job in self._current_jobs 
\ No newline at end of file
@@ -38,6 +38,10 @@ class FileConverter:
     def __init__(self):
         """Initialize the file converter."""
         self._ffmpeg_path = self._find_ffmpeg()
+        # Output paths claimed by in-flight conversions, so parallel jobs whose inputs
+        # share a name don't pick the same file before ffmpeg has created it
+        self._reserved_paths = set()
+        self._lock = threading.Lock()
         print(f"[DEBUG] FileConverter: Detected ffmpeg path: {self._ffmpeg_path}")
     
     def _find_ffmpeg(self) -> Optional[str]:
@@ -97,10 +101,12 @@ class FileConverter:
         # Ensure unique filename
         counter = 1
         original_output_path = output_path
-        while os.path.exists(output_path):
-            name_without_ext = os.path.splitext(original_output_path)[0]
-            output_path = f"{name_without_ext}_{counter}.{target_format}"
-            counter += 1
+        with self._lock:
+            while output_path in self._reserved_paths or os.path.exists(output_path):
+                name_without_ext = os.path.splitext(original_output_path)[0]
+                output_path = f"{name_without_ext}_{counter}.{target_format}"
+                counter += 1
+            self._reserved_paths.add(output_path)
         
         # Build ffmpeg command based on target format
         cmd = self._build_conversion_command(input_path, output_path, target_format)
@@ -141,6 +147,9 @@ class FileConverter:
             raise FFmpegError(f"FFmpeg subprocess error: {e}")
         except Exception as e:
             raise FFmpegError(f"Unexpected error during conversion: {e}")
+        finally:
+            with self._lock:
+                self._reserved_paths.discard(output_path)
     
     def _build_conversion_command(self, input_path: str, output_path: str, target_format: str) -> list:
         """
@@ -7,6 +7,7 @@ import subprocess
 import json
 import os
 import sys
+import threading
 import time
 from typing import Optional, Callable
 from pathlib import Path
@@ -42,22 +43,27 @@ class MetadataCache:
     def __init__(self, max_size: int = 100):
         self.cache = {}
         self.max_size = max_size
+        # Shared by the download workers
+        self._lock = threading.Lock()
     
     def get(self, url: str) -> Optional[dict]:
         """Get metadata from cache."""
-        return self.cache.get(url)
+        with self._lock:
+            return self.cache.get(url)
     
     def set(self, url: str, metadata: dict):
         """Set metadata in cache."""
-        if len(self.cache) >= self.max_size:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-        self.cache[url] = metadata
+        with self._lock:
+            if url not in self.cache and len(self.cache) >= self.max_size:
+                # Remove oldest entry (simple FIFO)
+                oldest_key = next(iter(self.cache))
+                del self.cache[oldest_key]
+            self.cache[url] = metadata
     
     def clear(self):
         """Clear the cache."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
 
 
 class Downloader:
@@ -70,6 +76,10 @@ class Downloader:
         self._ffmpeg_path = self._find_ffmpeg()
         self._yt_dlp_path = self._find_yt_dlp()
         self._active_processes = []  # Track active subprocesses
+        # Output paths claimed by in-flight downloads, so parallel jobs with the
+        # same title don't pick the same file before either has written it
+        self._reserved_paths = set()
+        self._lock = threading.Lock()  # Guards _active_processes and _reserved_paths
         self.metadata_cache = MetadataCache()
         print(f"[DEBUG] Detected ffmpeg path: {self._ffmpeg_path}")
         print(f"[DEBUG] Detected yt-dlp path: {self._yt_dlp_path}")
@@ -143,6 +153,7 @@ class Downloader:
         print(f"[DEBUG] Downloader: Received job with url={job.url}")
         print(f"[DEBUG] Downloader: Starting download for job: {job.url} (status: {job.status})")
         
+        unique_output_path = None
         try:
             # Check if job has been cancelled before starting
             if job.status == JobStatus.FAILED:
@@ -177,7 +188,6 @@ class Downloader:
                 return
             
             # Ensure unique output filename
-            unique_output_path = None
             if job.title:
                 base_name = sanitize_filename(job.title)
                 ext = job.format
@@ -187,9 +197,11 @@ class Downloader:
                     base_name += '_compatibility'
                 candidate = os.path.join(output_folder, f"{base_name}.{ext}")
                 counter = 1
-                while os.path.exists(candidate):
-                    candidate = os.path.join(output_folder, f"{base_name}_{counter}.{ext}")
-                    counter += 1
+                with self._lock:
+                    while candidate in self._reserved_paths or os.path.exists(candidate):
+                        candidate = os.path.join(output_folder, f"{base_name}_{counter}.{ext}")
+                        counter += 1
+                    self._reserved_paths.add(candidate)
                 # If we had to add a number, update the job title so yt-dlp uses the unique name
                 if counter > 1:
                     job.title = f"{base_name}_{counter-1}"
@@ -222,7 +234,8 @@ class Downloader:
             print(f"[DEBUG] Downloader: Subprocess started for {job.url}")
             
             # Track the process for cleanup
-            self._active_processes.append(process)
+            with self._lock:
+                self._active_processes.append(process)
             
             try:
                 # Monitor progress
@@ -273,8 +286,9 @@ class Downloader:
                     job.progress = 100.0
             finally:
                 # Remove from active processes list
-                if process in self._active_processes:
-                    self._active_processes.remove(process)
+                with self._lock:
+                    if process in self._active_processes:
+                        self._active_processes.remove(process)
             
         except ValueError as e:
             # URL validation error
@@ -314,6 +328,10 @@ class Downloader:
             job.status = JobStatus.FAILED
             job.error_message = str(e)
             raise
+        finally:
+            if unique_output_path is not None:
+                with self._lock:
+                    self._reserved_paths.discard(unique_output_path)
     
     def _build_command(self, url: str, output_template: str, job: DownloadJob, metadata: dict) -> list:
         """
@@ -832,7 +850,10 @@ class Downloader:
     
     def cleanup_subprocesses(self):
         """Clean up all active subprocesses."""
-        for process in self._active_processes:
+        with self._lock:
+            processes = list(self._active_processes)
+            self._active_processes.clear()
+        for process in processes:
             try:
                 if process.poll() is None:  # Process is still running
                     process.terminate()
@@ -842,8 +863,6 @@ class Downloader:
                         process.kill()  # Force kill if it doesn't terminate
             except Exception as e:
                 print(f"[DEBUG] Error cleaning up process: {e}")
-        
-        self._active_processes.clear()
     
     def __del__(self):
         """Cleanup when the downloader is destroyed."""
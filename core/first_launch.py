@@ -6,6 +6,7 @@ Handles automatic yt-dlp installation when the app is launched for the first tim
 import os
 import json
 import threading
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Optional, Callable
 from dataclasses import dataclass
@@ -27,12 +28,13 @@ class FirstLaunchManager:
     Manages first launch installation of yt-dlp.
     """
     
-    def __init__(self, app_data_dir: Optional[str] = None):
+    def __init__(self, app_data_dir: Optional[str] = None, executor: Optional[Executor] = None):
         """
         Initialize the first launch manager.
         
         Args:
             app_data_dir: Directory to store configuration and yt-dlp
+            executor: Shared executor for background installs; a one-off thread is used if None
         """
         if app_data_dir is None:
             self.app_data_dir = Path.home() / ".big_gay_downloader"
@@ -42,9 +44,17 @@ class FirstLaunchManager:
         self.config_file = self.app_data_dir / "first_launch_config.json"
         self.installer = YtDlpInstaller(str(self.app_data_dir))
         self.config = self._load_config()
+        self._executor = executor
         
         print(f"[DEBUG] FirstLaunchManager initialized with data dir: {self.app_data_dir}")
     
+    def _run_in_background(self, target: Callable[[], None]):
+        """Run target on the shared executor, or on a daemon thread without one."""
+        if self._executor is not None:
+            self._executor.submit(target)
+        else:
+            threading.Thread(target=target, daemon=True).start()
+    
     def _load_config(self) -> FirstLaunchConfig:
         """Load first launch configuration."""
         default_config = FirstLaunchConfig()
@@ -147,9 +157,8 @@ class FirstLaunchManager:
                 if completion_callback:
                     completion_callback(False, f"Installation error: {str(e)}")
         
-        # Start installation in background thread
-        thread = threading.Thread(target=install_thread, daemon=True)
-        thread.start()
+        # Start installation in the background
+        self._run_in_background(install_thread)
     
     def get_installation_status(self) -> dict:
         """
@@ -231,9 +240,8 @@ class FirstLaunchManager:
                 if completion_callback:
                     completion_callback(False, f"Update error: {str(e)}")
         
-        # Start update in background thread
-        thread = threading.Thread(target=update_thread, daemon=True)
-        thread.start()
+        # Start update in the background
+        self._run_in_background(update_thread)
     
     def get_installation_message(self) -> str:
         """
@@ -1,6 +1,6 @@
 """
 Queue manager for YouTube Downloader application.
-Handles FIFO queue with worker thread for downloads.
+Handles FIFO queue with worker threads for downloads.
 """
 
 import threading
@@ -9,6 +9,7 @@ import time
 from typing import Optional, Callable, List
 from dataclasses import dataclass, field
 from enum import Enum
+from urllib.parse import urlparse
 
 
 class JobStatus(Enum):
@@ -19,6 +20,15 @@ class JobStatus(Enum):
     FAILED = "failed"
 
 
+@dataclass(frozen=True)
+class JobUIState:
+    """Immutable snapshot of the job fields the UI draws, published as a single reference."""
+    status: JobStatus
+    progress: float = 0.0
+    speed: Optional[str] = None
+    eta: Optional[str] = None
+
+
 @dataclass
 class DownloadJob:
     """Represents a download job."""
@@ -35,71 +45,122 @@ class DownloadJob:
     eta: Optional[str] = None
     speed: Optional[str] = None
     progress_widgets: Optional[dict] = None
+    # Last state published for the UI; readers never see a half-updated mix of fields
+    ui_state: Optional[JobUIState] = field(default=None, compare=False, repr=False)
     
     def __hash__(self):
         """Make DownloadJob hashable based on url, format, and output_folder."""
         return hash((self.url, self.format, self.output_folder))
+    
+    @property
+    def dedupe_key(self) -> tuple:
+        """Fields that decide the output file, so two jobs with the same key are duplicates."""
+        return (self.url, self.format, self.output_folder, self.compatibility_mode)
+    
+    def publish_ui_state(self) -> JobUIState:
+        """Capture the drawn fields into a new JobUIState and swap it in."""
+        self.ui_state = JobUIState(self.status, self.progress, self.speed, self.eta)
+        return self.ui_state
+
+
+@dataclass(frozen=True)
+class AddJobsResult:
+    """How a batch of download jobs was handled when added from the UI."""
+    added: int = 0
+    duplicates: int = 0  # Already waiting, so skipped
+    rejected: int = 0  # Not added because the queue was full or refused them
 
 
 class DownloadQueue:
     """
-    FIFO queue manager for download jobs with worker thread.
+    FIFO queue manager for download jobs with a pool of worker threads.
     """
     
-    def __init__(self, download_callback: Callable[[DownloadJob], None], max_size: int = 100):
+    def __init__(self, download_callback: Callable[[DownloadJob], None], max_size: int = 100,
+                 max_concurrent: int = 1, max_per_host: Optional[int] = None):
         """
         Initialize the download queue.
         
         Args:
             download_callback: Function to call when a job should be downloaded
             max_size: Maximum number of jobs in the queue
+            max_concurrent: Number of jobs downloaded at the same time
+            max_per_host: Optional limit on simultaneous downloads from one host
         """
         self._jobs: List[DownloadJob] = []  # List-based queue for proper removal
         self._download_callback = download_callback
-        self._worker_thread = None
+        self._max_concurrent = max(1, max_concurrent)
+        self._max_per_host = max_per_host
+        self._worker_threads: List[threading.Thread] = []
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()  # New: pause event
         self._pause_event.set()  # Start paused by default
-        self._current_job: Optional[DownloadJob] = None
+        self._current_jobs: List[DownloadJob] = []  # Jobs being downloaded right now
         self._lock = threading.Lock()
         self._max_size = max_size
         self._condition = threading.Condition(self._lock)  # For thread synchronization
         
     def start(self):
-        """Start the worker thread."""
-        if self._worker_thread is None or not self._worker_thread.is_alive():
+        """Start the worker threads."""
+        self._worker_threads = [t for t in self._worker_threads if t.is_alive()]
+        if len(self._worker_threads) < self._max_concurrent:
             self._stop_event.clear()
             self._pause_event.clear()  # Clear pause when starting
-            self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-            self._worker_thread.start()
+            while len(self._worker_threads) < self._max_concurrent:
+                worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+                worker_thread.start()
+                self._worker_threads.append(worker_thread)
         else:
-            # If thread is already running, just resume it
+            # If threads are already running, just resume them
             self.resume()
     
     def stop(self):
-        """Stop the worker thread."""
+        """Stop the worker threads."""
         self._stop_event.set()
         with self._condition:
-            self._condition.notify_all()  # Wake up worker thread
-        if self._worker_thread and self._worker_thread.is_alive():
-            self._worker_thread.join(timeout=5)
+            self._condition.notify_all()  # Wake up worker threads
+        # One deadline shared by every worker, so closing waits at most 5 seconds in total
+        deadline = time.monotonic() + 5
+        for worker_thread in self._worker_threads:
+            if worker_thread.is_alive():
+                worker_thread.join(timeout=max(0.0, deadline - time.monotonic()))
     
     def pause(self):
-        """Pause the worker thread (it will stop processing new jobs)."""
+        """Pause the worker threads (they will stop processing new jobs)."""
         self._pause_event.set()
         print("[DEBUG] Download queue paused")
     
     def resume(self):
-        """Resume the worker thread (it will start processing jobs again)."""
+        """Resume the worker threads (they will start processing jobs again)."""
         self._pause_event.clear()
         with self._condition:
-            self._condition.notify_all()  # Wake up worker thread
+            self._condition.notify_all()  # Wake up worker threads
         print("[DEBUG] Download queue resumed")
     
     def is_paused(self) -> bool:
         """Check if the queue is currently paused."""
         return self._pause_event.is_set()
     
+    def pause_if_idle(self, finishing_job: Optional[DownloadJob] = None) -> bool:
+        """
+        Pause the queue if nothing is waiting and no other job is being downloaded.
+        
+        Checked under the queue lock, so a job added or claimed at the same
+        time keeps the queue running.
+        
+        Args:
+            finishing_job: The job whose worker is asking; it doesn't count as active
+            
+        Returns:
+            True if the queue was paused
+        """
+        with self._lock:
+            if self._jobs or any(current_job is not finishing_job for current_job in self._current_jobs):
+                return False
+            self._pause_event.set()
+        print("[DEBUG] Download queue paused")
+        return True
+    
     def add_job(self, job: DownloadJob) -> bool:
         """
         Add a job to the queue.
@@ -115,7 +176,7 @@ class DownloadQueue:
             if len(self._jobs) >= self._max_size:
                 return False
             self._jobs.append(job)
-            self._condition.notify_all()  # Wake up worker thread
+            self._condition.notify_all()  # Wake up worker threads
             return True
     
     def is_queue_full(self) -> bool:
@@ -138,7 +199,7 @@ class DownloadQueue:
             True if job was cancelled
         """
         with self._lock:
-            if self._current_job == job:
+            if job in self._current_jobs:
                 job.status = JobStatus.FAILED
                 return True
             
@@ -165,7 +226,7 @@ class DownloadQueue:
             print(f"[DEBUG] remove_job: Acquired lock for: {job.url}")
             
             # Check if it's the current job
-            is_current = (self._current_job == job)
+            is_current = job in self._current_jobs
             print(f"[DEBUG] remove_job: Is current job? {is_current} for: {job.url}")
             
             # Remove from queue if it's there
@@ -192,9 +253,9 @@ class DownloadQueue:
             return False
     
     def get_current_job(self) -> Optional[DownloadJob]:
-        """Get the currently downloading job."""
+        """Get the longest-running job currently downloading."""
         with self._lock:
-            return self._current_job
+            return self._current_jobs[0] if self._current_jobs else None
     
     def get_queue_size(self) -> int:
         """Get the number of jobs in the queue."""
@@ -223,10 +284,12 @@ class DownloadQueue:
                 job = None
                 with self._condition:
                     while not self._stop_event.is_set() and not self._pause_event.is_set():
-                        # Find next pending job
+                        # Find next pending job whose host has a free download slot
                         for i, queued_job in enumerate(self._jobs):
-                            if queued_job.status == JobStatus.PENDING:
+                            if queued_job.status == JobStatus.PENDING and self._host_has_capacity(queued_job):
                                 job = self._jobs.pop(i)
+                                # Claim it while still holding the lock so other workers see the host as busy
+                                self._current_jobs.append(job)
                                 print(f"[DEBUG] Worker: Popped job from queue: {job.url} (status: {job.status})")
                                 break
                         
@@ -239,23 +302,18 @@ class DownloadQueue:
                 if job is None:
                     continue
                 
-                # Set as current job
-                with self._lock:
-                    self._current_job = job
-                    print(f"[DEBUG] Worker: Set current job: {job.url} (status: {job.status})")
+                print(f"[DEBUG] Worker: Set current job: {job.url} (status: {job.status})")
                 
                 # Check if job was cancelled while we were getting it
                 if job.status == JobStatus.FAILED:
                     print(f"[DEBUG] Worker: Job was cancelled before processing: {job.url}")
-                    with self._lock:
-                        self._current_job = None
+                    self._clear_current_job(job)
                     continue
                 
                 # Additional check: if job was removed from UI (status changed to FAILED), skip it
                 if job.status == JobStatus.FAILED:
                     print(f"[DEBUG] Worker: Job was marked as failed after popping, skipping: {job.url}")
-                    with self._lock:
-                        self._current_job = None
+                    self._clear_current_job(job)
                     continue
                 
                 # Process the job
@@ -286,15 +344,33 @@ class DownloadQueue:
                 
                 finally:
                     # Clear current job
-                    with self._lock:
-                        self._current_job = None
-                        print(f"[DEBUG] Worker: Cleared current job: {job.url}")
+                    self._clear_current_job(job)
+                    print(f"[DEBUG] Worker: Cleared current job: {job.url}")
                 
             except Exception as e:
                 print(f"[DEBUG] Worker: Exception in worker loop: {e}")
                 import traceback
                 traceback.print_exc()
     
+    def _host_has_capacity(self, job: DownloadJob) -> bool:
+        """Check the per-host limit for a job. Must be called with the lock held."""
+        if not self._max_per_host:
+            return True
+        host = urlparse(job.url).netloc.lower()
+        active = sum(1 for current_job in self._current_jobs
+                     if urlparse(current_job.url).netloc.lower() == host)
+        return active < self._max_per_host
+    
+    def _clear_current_job(self, job: DownloadJob):
+        """Forget a job once its worker is done with it."""
+        with self._condition:
+            for i, current_job in enumerate(self._current_jobs):
+                if current_job is job:
+                    del self._current_jobs[i]
+                    break
+            # A host slot may have opened up for a waiting worker
+            self._condition.notify_all()
+    
     def update_job_progress(self, job: DownloadJob, progress: float, 
                           eta: Optional[str] = None, speed: Optional[str] = None):
         """
@@ -324,4 +400,4 @@ class DownloadQueue:
             True if the job is currently being processed
         """
         with self._lock:
-            return self._current_job == job 
\ No newline at end of file
+            return job in self._current_jobs 
\ No newline at end of file
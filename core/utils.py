@@ -8,14 +8,34 @@ import subprocess
 import json
 import sys
 import os
+import shutil
+import socket
+import functools
 from typing import Tuple, Optional
 from urllib.parse import urlparse, parse_qs
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    orjson = None
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Shell metacharacters rejected in URLs; '||', '>>' and '<<' are covered by the single characters
+_DANGEROUS_URL_RE = re.compile(r'[;|`$(){}\[\]<>]|&&')
+_YOUTUBE_DOMAINS = frozenset({'youtube.com', 'www.youtube.com', 'm.youtube.com', 'youtu.be', 'www.youtu.be'})
+_XVIDEOS_DOMAINS = frozenset({'xvideos.com', 'www.xvideos.com', 'm.xvideos.com'})
+# Characters that are invalid in Windows filenames, each mapped to '_'
+_INVALID_FILENAME_CHARSET = frozenset('<>:"/\\|?*')
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys(_INVALID_FILENAME_CHARSET, '_'))
+
+
+@functools.lru_cache(maxsize=128)
 def resource_path(relative_path: str) -> str:
     """
     Get absolute path to resource, works for dev and for PyInstaller onefile.
+    Results are memoized; the bundle root never changes while the app runs.
     """
     if hasattr(sys, '_MEIPASS'):  # type: ignore[attr-defined]
         return os.path.join(sys._MEIPASS, relative_path)  # type: ignore[attr-defined]
@@ -58,6 +78,13 @@ def _find_yt_dlp() -> str:
     return 'yt-dlp'
 
 
+def _format_yt_dlp_output(result: subprocess.CompletedProcess) -> str:
+    """Decode captured yt-dlp output for the debug dialog (error paths only)."""
+    stdout = result.stdout.decode('utf-8', errors='replace')
+    stderr = result.stderr.decode('utf-8', errors='replace')
+    return f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}\n\nReturn Code: {result.returncode}"
+
+
 def sanitize_url(url: str, mode: str = "youtube") -> str:
     """
     Sanitize and validate a URL to prevent command injection and ensure proper structure.
@@ -82,14 +109,19 @@ def sanitize_url(url: str, mode: str = "youtube") -> str:
     if len(url) > 2048:
         raise ValueError("URL is too long (maximum 2048 characters)")
     
-    # Check for command injection patterns
-    dangerous_patterns = [
-        ';', '|', '`', '$', '(', ')', '{', '}', '[', ']',
-        '&&', '||', '>>', '<<', '>', '<'
-    ]
-    for pattern in dangerous_patterns:
-        if pattern in url:
-            raise ValueError(f"URL contains dangerous pattern: {pattern}")
+    # Cheap rejections first so obviously bad URLs never reach the pattern scan or urlparse
+    url_lower = url.lower()
+    if not url_lower.startswith(('http://', 'https://')):
+        raise ValueError("Invalid URL format")
+    if mode == "youtube" and 'youtu' not in url_lower:
+        raise ValueError("URL must be from a valid YouTube domain")
+    if mode == "xvideos" and 'xvideos' not in url_lower:
+        raise ValueError("URL must be from a valid XVideos domain")
+    
+    # Check for command injection patterns in one scan
+    dangerous = _DANGEROUS_URL_RE.search(url)
+    if dangerous:
+        raise ValueError(f"URL contains dangerous pattern: {dangerous.group()}")
     
     # Basic URL format validation
     try:
@@ -98,38 +130,27 @@ def sanitize_url(url: str, mode: str = "youtube") -> str:
             raise ValueError("Invalid URL format")
     except Exception as e:
         raise ValueError(f"Invalid URL format: {e}")
+    netloc = parsed.netloc.lower()
     
     # Validate based on mode
     if mode == "youtube":
         # Check for YouTube domains
-        youtube_domains = [
-            'youtube.com',
-            'www.youtube.com',
-            'm.youtube.com',
-            'youtu.be',
-            'www.youtu.be'
-        ]
-        if parsed.netloc.lower() not in youtube_domains:
+        if netloc not in _YOUTUBE_DOMAINS:
             raise ValueError("URL must be from a valid YouTube domain")
         
         # Relaxed: For youtube.com, accept any path as long as 'v' or 'list' is present
-        if 'youtube.com' in parsed.netloc.lower():
+        if 'youtube.com' in netloc:
             query_params = parse_qs(parsed.query)
             if not ("v" in query_params or "list" in query_params):
                 raise ValueError("YouTube URL must contain video ID or playlist ID")
         
-        elif 'youtu.be' in parsed.netloc.lower():
+        elif 'youtu.be' in netloc:
             if not parsed.path or len(parsed.path) < 2:
                 raise ValueError("Invalid youtu.be URL format")
     
     elif mode == "xvideos":
         # Check for XVideos domains
-        xvideos_domains = [
-            'xvideos.com',
-            'www.xvideos.com',
-            'm.xvideos.com'
-        ]
-        if parsed.netloc.lower() not in xvideos_domains:
+        if netloc not in _XVIDEOS_DOMAINS:
             raise ValueError("URL must be from a valid XVideos domain")
         
         # XVideos URLs typically have paths like /video12345/title
@@ -143,9 +164,11 @@ def sanitize_url(url: str, mode: str = "youtube") -> str:
     return url
 
 
+@functools.lru_cache(maxsize=512)
 def is_valid_url(url: str, mode: str = "youtube") -> bool:
     """
     Validate if the given URL is a valid URL for the specified mode.
+    Results are memoized, so re-validating the same pasted URL is a dict lookup.
     
     Args:
         url: The URL to validate
@@ -173,7 +196,7 @@ def get_playlist_videos(url: str, mode: str = "youtube") -> Tuple[list, Optional
         Tuple of (videos_list, error_details, yt_dlp_output)
         - videos_list: List of dictionaries with 'url' and 'title' keys for each video
         - error_details: Detailed error information if failed
-        - yt_dlp_output: Raw yt-dlp output (stdout + stderr)
+        - yt_dlp_output: Raw yt-dlp output (stdout + stderr), only captured on failure
     """
     if not is_valid_url(url, mode):
         return [], "Invalid URL format", None
@@ -191,25 +214,23 @@ def get_playlist_videos(url: str, mode: str = "youtube") -> Tuple[list, Optional
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            text=False,  # Raw bytes go straight to the JSON parser
             timeout=30,  # 30 second timeout
             creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
         )
         
-        # Capture full output for debugging
-        full_output = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}\n\nReturn Code: {result.returncode}"
-        
         if result.returncode != 0:
             error_msg = f"yt-dlp failed with return code {result.returncode}"
             if result.stderr:
-                error_msg += f"\nError: {result.stderr.strip()}"
-            return [], error_msg, full_output
+                error_msg += f"\nError: {result.stderr.decode('utf-8', errors='replace').strip()}"
+            return [], error_msg, _format_yt_dlp_output(result)
         
         try:
-            data = json.loads(result.stdout)
+            data = _json_loads(result.stdout)
         except json.JSONDecodeError as e:
-            error_msg = f"Failed to parse yt-dlp JSON output: {e}\nOutput: {result.stdout[:500]}..."
-            return [], error_msg, full_output
+            preview = result.stdout[:500].decode('utf-8', errors='replace')
+            error_msg = f"Failed to parse yt-dlp JSON output: {e}\nOutput: {preview}..."
+            return [], error_msg, _format_yt_dlp_output(result)
         
         videos = []
         
@@ -244,7 +265,7 @@ def get_playlist_videos(url: str, mode: str = "youtube") -> Tuple[list, Optional
                 'title': video_title
             })
         
-        return videos, None, full_output
+        return videos, None, None
         
     except subprocess.TimeoutExpired:
         return [], "yt-dlp command timed out after 30 seconds", None
@@ -267,7 +288,7 @@ def probe_playlist(url: str, mode: str = "youtube") -> Tuple[int, Optional[str],
         - video_count: Number of videos (1 for single video, >1 for playlist, 0 for error)
         - playlist_title: Title of playlist (None for single videos)
         - error_details: Detailed error information if failed
-        - yt_dlp_output: Raw yt-dlp output (stdout + stderr)
+        - yt_dlp_output: Raw yt-dlp output (stdout + stderr), only captured on failure
     """
     if not is_valid_url(url, mode):
         return 0, None, "Invalid URL format", None
@@ -285,25 +306,23 @@ def probe_playlist(url: str, mode: str = "youtube") -> Tuple[int, Optional[str],
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            text=False,  # Raw bytes go straight to the JSON parser
             timeout=30,  # 30 second timeout
             creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
         )
         
-        # Capture full output for debugging
-        full_output = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}\n\nReturn Code: {result.returncode}"
-        
         if result.returncode != 0:
             error_msg = f"yt-dlp failed with return code {result.returncode}"
             if result.stderr:
-                error_msg += f"\nError: {result.stderr.strip()}"
-            return 0, None, error_msg, full_output
+                error_msg += f"\nError: {result.stderr.decode('utf-8', errors='replace').strip()}"
+            return 0, None, error_msg, _format_yt_dlp_output(result)
         
         try:
-            data = json.loads(result.stdout)
+            data = _json_loads(result.stdout)
         except json.JSONDecodeError as e:
-            error_msg = f"Failed to parse yt-dlp JSON output: {e}\nOutput: {result.stdout[:500]}..."
-            return 0, None, error_msg, full_output
+            preview = result.stdout[:500].decode('utf-8', errors='replace')
+            error_msg = f"Failed to parse yt-dlp JSON output: {e}\nOutput: {preview}..."
+            return 0, None, error_msg, _format_yt_dlp_output(result)
         
         # Check if it's a playlist
         if 'entries' in data:
@@ -312,7 +331,7 @@ def probe_playlist(url: str, mode: str = "youtube") -> Tuple[int, Optional[str],
             valid_entries = [entry for entry in entries if entry is not None]
             count = len(valid_entries)
             title = data.get('title', 'Unknown Playlist')
-            return count, title, None, full_output
+            return count, title, None, None
         else:
             # Single video - check if we need to use webpage_url
             if mode == "xvideos":
@@ -325,7 +344,7 @@ def probe_playlist(url: str, mode: str = "youtube") -> Tuple[int, Optional[str],
                 # For YouTube, use the original URL or webpage_url if available
                 video_url = data.get('webpage_url', data.get('url', url))
             
-            return 1, None, None, full_output
+            return 1, None, None, None
             
     except subprocess.TimeoutExpired:
         return 0, None, "yt-dlp command timed out after 30 seconds", None
@@ -366,7 +385,6 @@ def validate_output_permissions(folder: str) -> bool:
         
         # Check available disk space (require at least 100MB free)
         try:
-            import shutil
             free_space = shutil.disk_usage(folder_path).free
             min_space = 100 * 1024 * 1024  # 100MB in bytes
             if free_space < min_space:
@@ -427,24 +445,23 @@ def _sanitize_filename_internal(filename: str) -> str:
     """
     Internal sanitization function to avoid recursive calls.
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Most titles are already clean; return them as-is without building a new string
+    if (filename and len(filename) <= 200 and _INVALID_FILENAME_CHARSET.isdisjoint(filename)
+            and filename[0] not in ' .' and filename[-1] not in ' .'):
+        return filename
     
-    # Remove leading/trailing whitespace and dots
-    filename = filename.strip(' .')
+    # Replace invalid characters and remove leading/trailing whitespace and dots
+    filename = filename.translate(_INVALID_FILENAME_CHARS).strip(' .')
     
     # Limit length
-    if len(filename) > 200:
-        filename = filename[:200]
-    
-    return filename or 'untitled'
+    return filename[:200] or 'untitled'
 
 
+@functools.lru_cache(maxsize=512)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by removing/replacing invalid characters.
+    Results are memoized; titles are often sanitized more than once per job.
     
     Args:
         filename: The filename to sanitize
@@ -468,8 +485,6 @@ def safe_error_message(error: Exception) -> str:
     error_str = str(error)
     
     # Remove system paths that might contain sensitive information
-    import re
-    
     # Remove absolute paths
     error_str = re.sub(r'/[A-Za-z]:/[^\\s]*', '[PATH]', error_str)
     error_str = re.sub(r'[A-Za-z]:\\[^\\s]*', '[PATH]', error_str)
@@ -523,7 +538,6 @@ def check_system_resources(output_folder: str) -> dict:
     Returns:
         Dictionary with resource status information
     """
-    import shutil
     import psutil
     
     status = {
@@ -558,7 +572,6 @@ def check_system_resources(output_folder: str) -> dict:
     
     try:
         # Check network connectivity (simple ping test)
-        import socket
         socket.create_connection(("8.8.8.8", 53), timeout=3)
     except Exception:
         status['network_ok'] = False
@@ -57,7 +57,8 @@ class VersionManager:
             return None
         
         # Remove 'v' prefix if present
-        version_string = version_string.lstrip('v')
+        if version_string.startswith('v'):
+            version_string = version_string[1:]
         
         # Basic semantic versioning pattern
         pattern = r'^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?$'
@@ -173,7 +174,8 @@ class VersionManager:
             return "Not installed"
         
         # Remove 'v' prefix and format
-        version = version.lstrip('v')
+        if version.startswith('v'):
+            version = version[1:]
         
         # Add "Version" prefix for clarity
         return f"Version {version}"
@@ -6,18 +6,117 @@ Handles installation, updates, and version management of yt-dlp.
 import os
 import sys
 import json
+import asyncio
+import hashlib
+import atexit
+import functools
 import shutil
-import tempfile
-import urllib.request
-import urllib.error
 import subprocess
 import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import requests
+from packaging.version import Version, InvalidVersion
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_indented(obj) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+RELEASES_URL = "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
+
+# How long a failed probe for a system-wide yt-dlp is remembered (seconds)
+SYSTEM_PROBE_NEGATIVE_TTL = 60.0
+
+_IS_WIN32 = sys.platform == 'win32'
+_YTDLP_EXE_NAME = 'yt-dlp.exe' if _IS_WIN32 else 'yt-dlp'
+# Keep yt-dlp from flashing a console window on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if _IS_WIN32 else 0
+
+# Only these keys are read from the releases payload; everything else (author and
+# uploader objects, per-asset metadata, reactions) is dropped while parsing
+_RELEASE_FIELDS = frozenset({'tag_name', 'body', 'published_at', 'assets', 'name', 'browser_download_url'})
+
+# Installers whose pending config changes are flushed at exit. Held weakly, so
+# registering for the exit hook doesn't keep every installer alive until then.
+_live_installers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_installer_configs():
+    """Save config changes still pending on any live installer."""
+    for installer in list(_live_installers):
+        installer._save_config()
+
+
+def _keep_release_fields(pairs):
+    """json object_pairs_hook that keeps only the release fields the installer uses."""
+    return {key: value for key, value in pairs if key in _RELEASE_FIELDS}
+
+
+def _parse_release(content: bytes) -> Dict[str, Any]:
+    """
+    Parse the releases payload, with orjson when available.
+    
+    Only the json path trims the result to _RELEASE_FIELDS, through its object hook;
+    orjson has no hook, and filtering its output afterwards would be an extra pass
+    over a payload that is already fully decoded in memory.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content, object_pairs_hook=_keep_release_fields)
+
+
+def _link_or_copy(src, dst):
+    """
+    Hardlink src to dst, copying instead when linking isn't possible.
+    
+    Downloads are renamed into place rather than rewritten, so a hardlinked
+    backup keeps pointing at the old binary's data.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device, unsupported filesystem, or dst already exists
+        shutil.copy2(src, dst)
+
+
+@functools.lru_cache(maxsize=1)
+def _bundled_yt_dlp_path() -> Optional[str]:
+    """Path of the yt-dlp bundled into a PyInstaller build; fixed for the process lifetime."""
+    meipass = getattr(sys, '_MEIPASS', None)
+    if meipass:
+        bundled_path = os.path.join(meipass, _YTDLP_EXE_NAME)
+        if os.path.exists(bundled_path):
+            return bundled_path
+    return None
+
+
+def _backup_number(path) -> int:
+    """Extract the sequence number from a yt-dlp_backup_<n>.exe path."""
+    try:
+        return int(os.path.basename(path)[len("yt-dlp_backup_"):-len(".exe")])
+    except ValueError:
+        return 0
+
 
 class InstallerStatus(Enum):
     """Status of the installer operations."""
@@ -60,6 +159,7 @@ class YtDlpInstaller:
         self.yt_dlp_dir = self.app_data_dir / "yt-dlp"
         self.config_file = self.app_data_dir / "installer_config.json"
         self.backup_dir = self.app_data_dir / "backups"
+        self._yt_dlp_exe_path = self.yt_dlp_dir / _YTDLP_EXE_NAME
         
         # Create directories
         self.yt_dlp_dir.mkdir(parents=True, exist_ok=True)
@@ -70,11 +170,50 @@ class YtDlpInstaller:
         self.status_message = ""
         self._status_callbacks = []
         
+        # Cached lookups, invalidated whenever the binary on disk changes
+        self._cached_path: Optional[str] = None
+        self._cached_version: Optional[str] = None
+        self._cached_version_path: Optional[str] = None
+        self._system_probe_failed_at = 0.0
+        
+        # Content-Length of the last download, used to verify it without launching it
+        self._last_download_size: Optional[int] = None
+        # Whether the last download matched the release's published SHA-256
+        self._last_download_sha256_ok = False
+        
+        # Backup paths, oldest first; listed once here and kept up to date in memory
+        self._backups = self._scan_backups()
+        
+        # Version lookups run concurrently and may both persist the config;
+        # changes are only marked dirty and flushed after a check/install or at exit
+        self._config_lock = threading.Lock()
+        self._config_dirty = False
+        
+        # Shared HTTP session so the release check and the download reuse keep-alive connections
+        self._session = self._create_session()
+        
         # Load configuration
         self.config = self._load_config()
+        _live_installers.add(self)
         
         print(f"[DEBUG] YtDlpInstaller initialized with data dir: {self.app_data_dir}")
     
+    def _create_session(self) -> requests.Session:
+        """Create the pooled HTTP session used for GitHub API and download requests."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def get_session(self) -> requests.Session:
+        """Get the HTTP session, e.g. to configure proxies or headers."""
+        return self._session
+    
     def _load_config(self) -> Dict[str, Any]:
         """Load installer configuration."""
         default_config = {
@@ -82,30 +221,39 @@ class YtDlpInstaller:
             "auto_update_enabled": True,
             "update_check_interval": 86400,  # 24 hours
             "installed_version": None,
-            "installation_date": None
+            "installation_date": None,
+            "latest_release_etag": None,
+            "latest_release_last_modified": None,
+            "latest_release_cached": None
         }
         
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    # Merge with defaults
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
+                config = _json_loads(self.config_file.read_bytes())
+                # Merge with defaults
+                for key, value in default_config.items():
+                    if key not in config:
+                        config[key] = value
+                return config
         except Exception as e:
             print(f"[DEBUG] Failed to load config: {e}")
         
         return default_config
     
     def _save_config(self):
-        """Save installer configuration."""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
-        except Exception as e:
-            print(f"[DEBUG] Failed to save config: {e}")
+        """Save installer configuration if it changed since the last save."""
+        with self._config_lock:
+            if not self._config_dirty:
+                return
+            
+            # Write a sibling temp file and swap it in so a crash never leaves half a config
+            temp_file = self.config_file.with_suffix('.tmp')
+            try:
+                temp_file.write_bytes(_json_dumps_indented(self.config))
+                os.replace(temp_file, self.config_file)
+                self._config_dirty = False
+            except Exception as e:
+                print(f"[DEBUG] Failed to save config: {e}")
     
     def add_status_callback(self, callback: Callable[[InstallerStatus, float, str], None]):
         """Add a callback for status updates."""
@@ -130,29 +278,43 @@ class YtDlpInstaller:
         Returns:
             Path to yt-dlp executable or None if not found
         """
+        # Reuse the previous lookup while the file is still there
+        if self._cached_path:
+            if self._cached_path == 'yt-dlp' or os.path.exists(self._cached_path):
+                return self._cached_path
+            self._invalidate_cache()
+        
         # Check bundled version first (for PyInstaller builds)
-        if hasattr(sys, '_MEIPASS'):
-            bundled_path = Path(sys._MEIPASS) / ('yt-dlp.exe' if sys.platform == 'win32' else 'yt-dlp')
-            if bundled_path.exists():
-                return str(bundled_path)
+        bundled_path = _bundled_yt_dlp_path()
+        if bundled_path:
+            self._cached_path = bundled_path
+            return self._cached_path
         
         # Check installed version
-        yt_dlp_exe = self.yt_dlp_dir / ('yt-dlp.exe' if sys.platform == 'win32' else 'yt-dlp')
-        if yt_dlp_exe.exists():
-            return str(yt_dlp_exe)
+        if self._yt_dlp_exe_path.exists():
+            self._cached_path = str(self._yt_dlp_exe_path)
+            return self._cached_path
         
-        # Fallback to system installation
-        try:
-            result = subprocess.run(['yt-dlp', '--version'], 
-                                  capture_output=True, text=True, timeout=5,
-                                  creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
-            if result.returncode == 0:
-                return 'yt-dlp'
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        # Don't repeat the PATH lookup if it failed recently
+        if time.monotonic() - self._system_probe_failed_at < SYSTEM_PROBE_NEGATIVE_TTL:
+            return None
         
+        # Fallback to system installation; a PATH lookup is enough here, whether it
+        # actually runs is checked by the callers that launch it
+        if shutil.which('yt-dlp'):
+            self._cached_path = 'yt-dlp'
+            return self._cached_path
+        
+        self._system_probe_failed_at = time.monotonic()
         return None
     
+    def _invalidate_cache(self):
+        """Forget the cached yt-dlp path and version."""
+        self._cached_path = None
+        self._cached_version = None
+        self._cached_version_path = None
+        self._system_probe_failed_at = 0.0
+    
     def get_current_version(self) -> Optional[str]:
         """
         Get the current version of yt-dlp.
@@ -164,66 +326,142 @@ class YtDlpInstaller:
         if not yt_dlp_path:
             return None
         
+        # The version can only change when the binary does, which invalidates the cache
+        if self._cached_version is not None and self._cached_version_path == yt_dlp_path:
+            return self._cached_version
+        
         try:
             result = subprocess.run([yt_dlp_path, '--version'], 
                                   capture_output=True, text=True, timeout=10,
-                                  creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
+                                  creationflags=_CREATION_FLAGS)
             if result.returncode == 0:
-                version = result.stdout.strip()
-                # Update config with current version
-                self.config["installed_version"] = version
-                self._save_config()
-                return version
+                return self._store_current_version(yt_dlp_path, result.stdout.strip())
         except Exception as e:
             print(f"[DEBUG] Failed to get current version: {e}")
         
         return None
     
-    def get_latest_version_info(self) -> Optional[Dict[str, Any]]:
+    async def get_current_version_async(self) -> Optional[str]:
         """
-        Get information about the latest yt-dlp release.
+        Get the current version of yt-dlp without blocking the event loop.
         
         Returns:
-            Dictionary with release information or None if failed
+            Version string or None if not available
+        """
+        yt_dlp_path = self.get_yt_dlp_path()
+        if not yt_dlp_path:
+            return None
+        
+        if self._cached_version is not None and self._cached_version_path == yt_dlp_path:
+            return self._cached_version
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                yt_dlp_path, '--version',
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                creationflags=_CREATION_FLAGS)
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
+            if process.returncode == 0:
+                return self._store_current_version(yt_dlp_path, stdout.decode(errors='replace').strip())
+        except Exception as e:
+            print(f"[DEBUG] Failed to get current version: {e}")
+        
+        return None
+    
+    def _store_current_version(self, yt_dlp_path: str, version: str) -> str:
+        """Cache the version read from yt_dlp_path and record it in the config."""
+        self._cached_version = version
+        self._cached_version_path = yt_dlp_path
+        # Update config with current version
+        self.config["installed_version"] = version
+        self._config_dirty = True
+        return version
+    
+    def _open_release_request(self) -> Optional[Tuple[requests.Response, Optional[Dict[str, Any]]]]:
+        """
+        Send the latest-release request without reading the body yet.
+        
+        Returns:
+            (streamed response, cached release info it was made against), or None if it failed
         """
         try:
-            # Get latest release info from GitHub API
-            url = "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
-            
             self._update_status(InstallerStatus.CHECKING, 0.0, "Checking for updates...")
             
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                
-                # Find the appropriate asset for the current platform
-                assets = data.get('assets', [])
-                target_asset = None
+            # Conditional request: GitHub answers 304 (not counted against the rate limit)
+            # when the release is unchanged since the cached ETag / Last-Modified
+            headers = {}
+            cached = self.config.get("latest_release_cached")
+            if cached:
+                if self.config.get("latest_release_etag"):
+                    headers["If-None-Match"] = self.config["latest_release_etag"]
+                if self.config.get("latest_release_last_modified"):
+                    headers["If-Modified-Since"] = self.config["latest_release_last_modified"]
+            
+            response = self._session.get(RELEASES_URL, headers=headers, timeout=10, stream=True)
+            return response, cached
+        except Exception as e:
+            print(f"[DEBUG] Failed to get latest version info: {e}")
+            return None
+    
+    def _read_release_response(self, response: requests.Response,
+                               cached: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Read and parse a response from _open_release_request.
+        
+        Returns:
+            (release information or None if failed, whether the release was unchanged)
+        """
+        try:
+            if response.status_code == 304 and cached:
+                return dict(cached), True
+            response.raise_for_status()
+            data = _parse_release(response.content)
+            
+            # Find the appropriate asset for the current platform
+            assets_by_name = {asset['name']: asset for asset in data.get('assets', [])}
+            target_asset = assets_by_name.get(_YTDLP_EXE_NAME)
+            
+            if target_asset:
+                latest_info = {
+                    'version': data['tag_name'].lstrip('v'),
+                    'download_url': target_asset['browser_download_url'],
+                    'release_notes': data.get('body', ''),
+                    'published_at': data.get('published_at', ''),
+                    'checksums_url': assets_by_name.get('SHA2-256SUMS', {}).get('browser_download_url', '')
+                }
                 
-                if sys.platform == 'win32':
-                    # Look for Windows executable
-                    for asset in assets:
-                        if asset['name'] == 'yt-dlp.exe':
-                            target_asset = asset
-                            break
-                else:
-                    # Look for Linux/macOS binary
-                    for asset in assets:
-                        if asset['name'] == 'yt-dlp':
-                            target_asset = asset
-                            break
+                # Remember the validators so the next check can be a 304
+                self.config["latest_release_etag"] = response.headers.get("ETag")
+                self.config["latest_release_last_modified"] = response.headers.get("Last-Modified")
+                self.config["latest_release_cached"] = latest_info
+                self._config_dirty = True
                 
-                if target_asset:
-                    return {
-                        'version': data['tag_name'].lstrip('v'),
-                        'download_url': target_asset['browser_download_url'],
-                        'release_notes': data.get('body', ''),
-                        'published_at': data.get('published_at', '')
-                    }
+                return dict(latest_info), False
                 
         except Exception as e:
             print(f"[DEBUG] Failed to get latest version info: {e}")
+        finally:
+            response.close()
         
-        return None
+        return None, False
+    
+    def get_latest_version_info(self) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Get information about the latest yt-dlp release.
+        
+        Returns:
+            (dictionary with release information or None if failed,
+             whether GitHub answered 304 Not Modified for the cached release)
+        """
+        request = self._open_release_request()
+        if request is None:
+            return None, False
+        return self._read_release_response(*request)
     
     def check_for_updates(self) -> UpdateInfo:
         """
@@ -232,9 +470,59 @@ class YtDlpInstaller:
         Returns:
             UpdateInfo object with update status
         """
-        current_version = self.get_current_version()
-        latest_info = self.get_latest_version_info()
+        installed_version = self.config.get("installed_version")
+        if (installed_version and self.config.get("latest_release_etag")
+                and self._cached_version is None and self.get_yt_dlp_path()):
+            # Ask GitHub first: if the release is unchanged since the last check,
+            # the recorded version is still current and yt-dlp needn't be launched.
+            # Otherwise --version runs while the release body is read and parsed.
+            request = self._open_release_request()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                current_future = None
+                if request is None or request[0].status_code != 304:
+                    current_future = executor.submit(self.get_current_version)
+                latest_info, not_modified = (self._read_release_response(*request)
+                                             if request is not None else (None, False))
+                if not_modified:
+                    current_version = installed_version
+                elif current_future is not None:
+                    current_version = current_future.result()
+                else:
+                    current_version = self.get_current_version()
+            self._save_config()
+            return self._build_update_info(current_version, latest_info)
+        
+        # The local --version call and the GitHub request are independent I/O waits
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(self.get_current_version)
+            latest_future = executor.submit(self.get_latest_version_info)
+            current_version = current_future.result()
+            latest_info, _ = latest_future.result()
+        
+        self._save_config()
+        return self._build_update_info(current_version, latest_info)
+    
+    async def check_for_updates_async(self) -> UpdateInfo:
+        """
+        Check if updates are available without blocking the event loop.
+        
+        The version check runs as an asyncio subprocess; the GitHub request reuses
+        the installer's requests session on the loop's default executor.
         
+        Returns:
+            UpdateInfo object with update status
+        """
+        loop = asyncio.get_running_loop()
+        current_version, (latest_info, _) = await asyncio.gather(
+            self.get_current_version_async(),
+            loop.run_in_executor(None, self.get_latest_version_info),
+        )
+        await loop.run_in_executor(None, self._save_config)
+        return self._build_update_info(current_version, latest_info)
+    
+    def _build_update_info(self, current_version: Optional[str],
+                           latest_info: Optional[Dict[str, Any]]) -> UpdateInfo:
+        """Combine the installed version and the latest release into an UpdateInfo."""
         if not current_version:
             return UpdateInfo(
                 current_version="Not installed",
@@ -276,12 +564,22 @@ class YtDlpInstaller:
             return tuple(int(part) for part in parts)
         
         try:
+            # Fast path: plain numeric CalVer such as 2024.08.06 or 2024.08.06.232843
             v1_tuple = version_to_tuple(version1)
             v2_tuple = version_to_tuple(version2)
             return (v1_tuple > v2_tuple) - (v1_tuple < v2_tuple)
         except ValueError:
-            # If version parsing fails, do string comparison
-            return (version1 > version2) - (version1 < version2)
+            pass
+        
+        # Pre-release/dev suffixes (e.g. 2024.08.06.dev0) need PEP 440 ordering
+        try:
+            v1, v2 = Version(version1), Version(version2)
+            return (v1 > v2) - (v1 < v2)
+        except InvalidVersion:
+            pass
+        
+        # If version parsing fails, do string comparison
+        return (version1 > version2) - (version1 < version2)
     
     def install_yt_dlp(self, progress_callback: Optional[Callable[[float, str], None]] = None) -> bool:
         """
@@ -294,19 +592,29 @@ class YtDlpInstaller:
             True if installation was successful
         """
         try:
-            # Get latest version info
-            latest_info = self.get_latest_version_info()
+            # Get latest version info and back up the existing installation concurrently
+            backups_before = len(self._backups)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                latest_future = executor.submit(self.get_latest_version_info)
+                backup_future = executor.submit(self._create_backup)
+                latest_info, _ = latest_future.result()
+                backup_created = backup_future.result()
+            
             if not latest_info:
+                # Nothing will be installed, so the backup just taken is a duplicate
+                if len(self._backups) > backups_before:
+                    self._discard_newest_backup()
                 self._update_status(InstallerStatus.FAILED, 0.0, "Failed to get latest version information")
                 return False
             
             # Create backup of existing installation
-            if not self._create_backup():
+            if not backup_created:
                 self._update_status(InstallerStatus.FAILED, 0.0, "Failed to create backup")
                 return False
             
-            # Download new version
-            if not self._download_yt_dlp(latest_info['download_url'], progress_callback):
+            # Download new version, checked against the release's SHA2-256SUMS when published
+            expected_sha256 = self._fetch_expected_sha256(latest_info.get('checksums_url'))
+            if not self._download_yt_dlp(latest_info['download_url'], progress_callback, expected_sha256):
                 self._update_status(InstallerStatus.FAILED, 0.0, "Failed to download yt-dlp")
                 return False
             
@@ -326,7 +634,7 @@ class YtDlpInstaller:
             self.config["installed_version"] = latest_info['version']
             self.config["installation_date"] = time.time()
             self.config["last_update_check"] = time.time()
-            self._save_config()
+            self._config_dirty = True
             
             self._update_status(InstallerStatus.COMPLETED, 100.0, f"Successfully installed yt-dlp {latest_info['version']}")
             return True
@@ -335,6 +643,9 @@ class YtDlpInstaller:
             print(f"[DEBUG] Installation failed: {e}")
             self._update_status(InstallerStatus.FAILED, 0.0, f"Installation failed: {str(e)}")
             return False
+        finally:
+            # Flush whatever the release check and the install recorded
+            self._save_config()
     
     def _create_backup(self) -> bool:
         """Create backup of existing yt-dlp installation."""
@@ -349,8 +660,10 @@ class YtDlpInstaller:
                 return True
             
             # Create backup
-            backup_path = self.backup_dir / f"yt-dlp_backup_{int(time.time())}.exe"
-            shutil.copy2(current_path, backup_path)
+            next_number = _backup_number(self._backups[-1]) + 1 if self._backups else 1
+            backup_path = self.backup_dir / f"yt-dlp_backup_{next_number:06d}.exe"
+            _link_or_copy(current_path, backup_path)
+            self._backups.append(str(backup_path))
             print(f"[DEBUG] Created backup: {backup_path}")
             return True
             
@@ -358,37 +671,89 @@ class YtDlpInstaller:
             print(f"[DEBUG] Failed to create backup: {e}")
             return False
     
-    def _download_yt_dlp(self, download_url: str, progress_callback: Optional[Callable[[float, str], None]] = None) -> bool:
-        """Download yt-dlp from the given URL."""
+    def _fetch_expected_sha256(self, checksums_url: Optional[str]) -> Optional[str]:
+        """Get the published SHA-256 of the platform binary from a SHA2-256SUMS file."""
+        if not checksums_url:
+            return None
+        
+        try:
+            response = self._session.get(checksums_url, timeout=10)
+            response.raise_for_status()
+            # Each line is "<hex digest>  <file name>"
+            for line in response.text.splitlines():
+                parts = line.split()
+                if len(parts) == 2 and parts[1].lstrip('*') == _YTDLP_EXE_NAME:
+                    return parts[0].lower()
+        except Exception as e:
+            print(f"[DEBUG] Failed to get release checksums: {e}")
+        
+        return None
+    
+    def _download_yt_dlp(self, download_url: str, progress_callback: Optional[Callable[[float, str], None]] = None,
+                         expected_sha256: Optional[str] = None) -> bool:
+        """Download yt-dlp from the given URL, hashing it on the way if a digest is given."""
+        self._invalidate_cache()
+        self._last_download_sha256_ok = False
+        final_path = self._yt_dlp_exe_path
+        # Stream into a sibling .part file so the final os.replace is an atomic same-filesystem rename
+        part_path = final_path.with_suffix('.part')
+        
         try:
             self._update_status(InstallerStatus.DOWNLOADING, 0.0, "Downloading yt-dlp...")
             
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.exe' if sys.platform == 'win32' else '')
-            temp_path = temp_file.name
-            temp_file.close()
+            # Download with progress, throttled to every 50 ms or 1% so the status
+            # callbacks don't run once per chunk
+            last_emit_time = 0.0
+            last_emit_progress = -100.0
             
-            # Download with progress
-            def download_progress(block_num, block_size, total_size):
+            def download_progress(downloaded, total_size, force=False):
+                nonlocal last_emit_time, last_emit_progress
                 if total_size > 0:
-                    progress = (block_num * block_size) / total_size * 100
+                    progress = downloaded / total_size * 100
+                    now = time.monotonic()
+                    if progress == last_emit_progress:
+                        return
+                    if not force and now - last_emit_time < 0.05 and progress - last_emit_progress < 1.0:
+                        return
+                    last_emit_time = now
+                    last_emit_progress = progress
                     self._update_status(InstallerStatus.DOWNLOADING, progress, f"Downloading... {progress:.1f}%")
                     if progress_callback:
                         progress_callback(progress, f"Downloading... {progress:.1f}%")
             
-            urllib.request.urlretrieve(download_url, temp_path, download_progress)
+            # Ask for the raw bytes so iter_content has nothing to decompress
+            headers = {"Accept-Encoding": "identity"}
+            with self._session.get(download_url, headers=headers, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('Content-Length', 0))
+                self._last_download_size = total_size or None
+                downloaded = 0
+                hasher = hashlib.sha256()
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        hasher.update(chunk)
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        download_progress(downloaded, total_size)
+                download_progress(downloaded, total_size, force=True)
             
             # Verify download
-            if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
-                os.unlink(temp_path)
+            if downloaded == 0:
+                part_path.unlink()
                 return False
             
+            if expected_sha256:
+                if hasher.hexdigest() != expected_sha256:
+                    print(f"[DEBUG] Checksum mismatch for downloaded yt-dlp: {hasher.hexdigest()}")
+                    part_path.unlink()
+                    return False
+                self._last_download_sha256_ok = True
+            
             # Move to final location
-            final_path = self.yt_dlp_dir / ('yt-dlp.exe' if sys.platform == 'win32' else 'yt-dlp')
-            shutil.move(temp_path, final_path)
+            os.replace(part_path, final_path)
             
             # Make executable on Unix systems
-            if sys.platform != 'win32':
+            if not _IS_WIN32:
                 os.chmod(final_path, 0o755)
             
             print(f"[DEBUG] Downloaded yt-dlp to: {final_path}")
@@ -396,6 +761,10 @@ class YtDlpInstaller:
             
         except Exception as e:
             print(f"[DEBUG] Download failed: {e}")
+            try:
+                part_path.unlink()
+            except OSError:
+                pass
             return False
     
     def _install_downloaded_file(self) -> bool:
@@ -405,8 +774,9 @@ class YtDlpInstaller:
             
             # The file should already be in the correct location
             # Just verify it exists and is executable
-            yt_dlp_path = self.yt_dlp_dir / ('yt-dlp.exe' if sys.platform == 'win32' else 'yt-dlp')
+            yt_dlp_path = self._yt_dlp_exe_path
             
+            self._invalidate_cache()
             if not yt_dlp_path.exists():
                 return False
             
@@ -425,10 +795,18 @@ class YtDlpInstaller:
             if not yt_dlp_path:
                 return False
             
+            # A download matching the published checksum, or failing that a complete
+            # file with the right executable header, is good enough; only launch the
+            # binary when neither check applies
+            if self._last_download_sha256_ok and yt_dlp_path == str(self._yt_dlp_exe_path):
+                return True
+            if self._looks_like_complete_binary(yt_dlp_path):
+                return True
+            
             # Test the installation
             result = subprocess.run([yt_dlp_path, '--version'], 
                                   capture_output=True, text=True, timeout=10,
-                                  creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
+                                  creationflags=_CREATION_FLAGS)
             
             return result.returncode == 0
             
@@ -436,19 +814,42 @@ class YtDlpInstaller:
             print(f"[DEBUG] Verification failed: {e}")
             return False
     
+    def _looks_like_complete_binary(self, yt_dlp_path: str) -> bool:
+        """Check the executable header and the size against the last download."""
+        if not self._last_download_size or not os.path.isfile(yt_dlp_path):
+            return False
+        
+        try:
+            if os.path.getsize(yt_dlp_path) != self._last_download_size:
+                return False
+            with open(yt_dlp_path, 'rb') as f:
+                header = f.read(4)
+        except OSError:
+            return False
+        
+        if _IS_WIN32:
+            return header[:2] == b'MZ'
+        # ELF on Linux, Mach-O on macOS, or the zipapp's shebang line
+        return header in (b'\x7fELF', b'\xcf\xfa\xed\xfe') or header[:2] == b'#!'
+    
     def _restore_backup(self) -> bool:
         """Restore from backup if installation failed."""
         try:
             # Find the most recent backup
-            backup_files = list(self.backup_dir.glob("yt-dlp_backup_*.exe"))
-            if not backup_files:
+            if not self._backups:
                 return False
             
-            latest_backup = max(backup_files, key=lambda f: f.stat().st_mtime)
+            latest_backup = self._backups[-1]
             
             # Restore
-            yt_dlp_path = self.yt_dlp_dir / ('yt-dlp.exe' if sys.platform == 'win32' else 'yt-dlp')
-            shutil.copy2(latest_backup, yt_dlp_path)
+            yt_dlp_path = self._yt_dlp_exe_path
+            # Stage next to the target and swap it in atomically; the backup itself is kept
+            restore_path = yt_dlp_path.with_suffix('.restore')
+            if restore_path.exists():
+                restore_path.unlink()
+            _link_or_copy(latest_backup, restore_path)
+            os.replace(restore_path, yt_dlp_path)
+            self._invalidate_cache()
             
             print(f"[DEBUG] Restored from backup: {latest_backup}")
             return True
@@ -457,6 +858,32 @@ class YtDlpInstaller:
             print(f"[DEBUG] Failed to restore backup: {e}")
             return False
     
+    def _discard_newest_backup(self):
+        """Delete the most recent backup, e.g. one taken for an install that never started."""
+        try:
+            backup_file = self._backups.pop()
+            os.unlink(backup_file)
+            print(f"[DEBUG] Discarded unused backup: {backup_file}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[DEBUG] Failed to discard backup: {e}")
+    
+    def _scan_backups(self) -> list:
+        """
+        List backup file paths, oldest first.
+        
+        Backup names embed an increasing number (older installs used a timestamp),
+        so ordering by it sorts them by age without a stat() per file.
+        """
+        with os.scandir(self.backup_dir) as entries:
+            backup_files = [
+                entry.path for entry in entries
+                if entry.name.startswith("yt-dlp_backup_") and entry.name.endswith(".exe")
+            ]
+        backup_files.sort(key=_backup_number)
+        return backup_files
+    
     def is_installed(self) -> bool:
         """Check if yt-dlp is installed."""
         return self.get_yt_dlp_path() is not None
@@ -474,16 +901,18 @@ class YtDlpInstaller:
     def cleanup_old_backups(self, keep_count: int = 3):
         """Clean up old backup files, keeping the most recent ones."""
         try:
-            backup_files = list(self.backup_dir.glob("yt-dlp_backup_*.exe"))
-            if len(backup_files) <= keep_count:
+            remove_count = len(self._backups) - keep_count
+            if remove_count <= 0:
                 return
             
-            # Sort by modification time and remove oldest
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            for backup_file in backup_files[keep_count:]:
-                backup_file.unlink()
+            # Oldest first, so the leading entries are the ones to drop
+            for backup_file in self._backups[:remove_count]:
+                try:
+                    os.unlink(backup_file)
+                except FileNotFoundError:
+                    pass
                 print(f"[DEBUG] Removed old backup: {backup_file}")
+            del self._backups[:remove_count]
                 
         except Exception as e:
             print(f"[DEBUG] Failed to cleanup backups: {e}") 
\ No newline at end of file
@@ -8,9 +8,37 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import yt_dlp
+except ImportError:  # fall back to the standalone executable
+    yt_dlp = None
+
+# One YoutubeDL instance for the whole run so extractors are only set up once
+_ydl = None
+
+def _get_ydl():
+    global _ydl
+    if _ydl is None:
+        _ydl = yt_dlp.YoutubeDL({'quiet': True, 'skip_download': True, 'noplaylist': True})
+    return _ydl
+
 def test_video_info():
     url = "https://youtu.be/chkOkcEFGM0?si=E13RKzQ1oYSEs46x"
     
+    if yt_dlp is not None:
+        print(f"Extracting with yt_dlp {yt_dlp.version.__version__}: {url}")
+        try:
+            metadata = _get_ydl().extract_info(url, download=False)
+            print(f"Extracted info with {len(metadata)} keys")
+            print(f"Title: {metadata.get('title', 'N/A')}")
+            return metadata
+        except Exception as e:
+            print(f"Exception: {e}")
+            return None
+    
+    return _test_video_info_subprocess(url)
+
+def _test_video_info_subprocess(url):
     # Find yt-dlp path
     yt_dlp_path = "C:\\Users\\mcgah\\.big_gay_downloader\\yt-dlp\\yt-dlp.exe"
     
@@ -81,12 +109,12 @@ def test_downloader_class():
         return None
 
 if __name__ == "__main__":
-    print("Testing direct subprocess call:")
+    print("Testing direct extraction:")
     metadata = test_video_info()
     if metadata:
-        print("Direct subprocess: Success!")
+        print("Direct extraction: Success!")
     else:
-        print("Direct subprocess: Failed!")
+        print("Direct extraction: Failed!")
     
     print("\nTesting Downloader class:")
     downloader_result = test_downloader_class()
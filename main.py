@@ -8,9 +8,18 @@ from tkinter import messagebox
 import os
 import json
 import threading
+import queue
+import time
+from concurrent.futures import Executor, Future
 import sys
-from pathlib import Path
-import traceback
+from pathlib import Path, PurePath
+from typing import List
+import logging
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    orjson = None
 
 # Explicit imports for PyInstaller bundling
 import core.utils
@@ -23,19 +32,89 @@ import core.conversion_queue
 import ui.sidebar
 import ui.queue_view
 import ui.conversion_queue_view
-import ui.update_dialog
 
-from core.queue import DownloadQueue, DownloadJob, JobStatus
-from core.conversion_queue import ConversionQueue, ConversionJob, ConversionStatus
+from core.queue import DownloadQueue, DownloadJob, JobStatus, AddJobsResult
+from core.conversion_queue import ConversionQueue, ConversionJob, ConversionStatus, AddResult
 from core.downloader import Downloader
 from core.converter import FileConverter
 from core.utils import safe_error_message, resource_path
 from core.first_launch import FirstLaunchManager
-from core.yt_dlp_installer import InstallerStatus
 from ui.sidebar import SidebarFrame
 from ui.queue_view import QueueViewFrame
 from ui.conversion_queue_view import ConversionQueueViewFrame
-from ui.update_dialog import UpdateDialog, UpdateNotificationDialog
+
+
+log = logging.getLogger("bgd")
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+CONFIG_DIR = Path.home() / ".simple_ytdl"
+CONFIG_PATH = CONFIG_DIR / "config.json"
+WINDOW_WIDTH, WINDOW_HEIGHT = 1600, 900  # Larger for high-tech layout
+ICON_PATH = resource_path('assets/icon.ico') if sys.platform == 'win32' else None
+
+
+def _json_dumps_indented(obj) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+class _DaemonExecutor(Executor):
+    """
+    Small fixed-size executor whose workers are daemon threads.
+    ThreadPoolExecutor workers are joined at interpreter exit, so an update
+    check or yt-dlp install still in flight would keep the closed app alive.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._work = queue.SimpleQueue()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{thread_name_prefix}_{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        future = Future()
+        self._work.put((future, fn, args, kwargs))
+        return future
+    
+    def _worker(self):
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+    
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._work.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in self._threads:
+            self._work.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
 
 
 class BigGayDownloader:
@@ -51,57 +130,45 @@ class BigGayDownloader:
         
         self.root = ctk.CTk()
         self.root.title("Big Gay Downloader - Advanced Media Processor")
-        self.root.geometry("1600x900")  # Larger for high-tech layout
+        # Issue one centered geometry up front instead of resizing after the UI is built
+        self._center_window()
         self.root.minsize(1400, 700)
         
-        # Set window icon
-        try:
-            # Try different paths for icon (development vs built)
-            icon_paths = [
-                resource_path('assets/icon.png'),  # PNG preferred for iconphoto
-                resource_path('assets/icon.ico'),  # ICO fallback
-            ]
-            icon_set = False
-            for icon_path in icon_paths:
-                if Path(icon_path).exists():
-                    if icon_path.lower().endswith('.ico'):
-                        self.root.iconbitmap(icon_path)
-                        icon_set = True
-                        break
-                    elif icon_path.lower().endswith('.png'):
-                        try:
-                            # CustomTkinter doesn't support iconphoto the same way as Tkinter
-                            # We'll skip icon setting for PNG files in CustomTkinter
-                            icon_set = True
-                            break
-                        except Exception as e:
-                            print(f"Could not load PNG icon: {e}")
-                            continue
-            if not icon_set:
-                print("Could not find or load icon file")
-        except Exception as e:
-            print(f"Could not set window icon: {e}")
+        # Set window icon (.ico via iconbitmap only works on Windows)
+        if ICON_PATH:
+            try:
+                self.root.iconbitmap(ICON_PATH)
+            except Exception as e:
+                log.warning("Could not set window icon: %s", e)
+        
+        # Load configuration
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        self.config = self._load_config()
+        
+        # Shared by background work (update checks, yt-dlp installs, config writes);
+        # daemon workers so none of it holds the process open after close
+        self._bg_executor = _DaemonExecutor(max_workers=2, thread_name_prefix="bgd-bg")
         
         # Initialize components
         self.downloader = Downloader()
         self.file_converter = FileConverter()
-        self.download_queue = DownloadQueue(self._download_job)
-        self.conversion_queue = ConversionQueue(self._convert_job)
+        self.download_queue = DownloadQueue(
+            self._download_job,
+            max_concurrent=self.config["max_concurrent_downloads"],
+            max_per_host=self.config["max_downloads_per_host"]
+        )
+        self.conversion_queue = ConversionQueue(
+            self._convert_job, max_workers=self.config["conversion_workers"]
+        )
         
         # Initialize first launch manager
-        self.first_launch_manager = FirstLaunchManager()
-        
-        # Load configuration
-        self.config = self._load_config()
+        self.first_launch_manager = FirstLaunchManager(executor=self._bg_executor)
         
         # Setup UI
         self._setup_ui()
         
-        # Center the window on screen (after UI setup for accurate dimensions)
-        self._center_window()
-        
-        # Setup UI update timer
-        self._setup_ui_updates()
+        # Job redraws are pushed from the worker threads instead of polled
+        self._setup_ui_events()
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -111,16 +178,11 @@ class BigGayDownloader:
         
         self.downloads_running = False
         self.conversions_running = False
-        self._cleanup_counter = 0  # Initialize cleanup counter
     
     def _center_window(self):
         """Center the window on the screen."""
-        # Update the window to get accurate dimensions
-        self.root.update_idletasks()
-        
-        # Get window dimensions
-        window_width = self.root.winfo_width()
-        window_height = self.root.winfo_height()
+        # The size is fixed, so there's no need to force a layout pass to measure it
+        window_width, window_height = WINDOW_WIDTH, WINDOW_HEIGHT
         
         # Get screen dimensions
         screen_width = self.root.winfo_screenwidth()
@@ -135,41 +197,78 @@ class BigGayDownloader:
     
     def _load_config(self) -> dict:
         """Load application configuration."""
-        config_path = Path.home() / ".simple_ytdl" / "config.json"
         default_config = {
             "output_folder": str(Path.home() / "Downloads"),
-            "last_format": "mp4"
+            "last_format": "mp4",
+            # Conversions run in parallel, one ffmpeg process per worker
+            "conversion_workers": min(os.cpu_count() or 1, 4),
+            # Parallel downloads, optionally limited per host (null for no limit)
+            "max_concurrent_downloads": 3,
+            "max_downloads_per_host": None
         }
         
+        # Saves are debounced and written off the Tk thread
+        self._config_dirty = False
+        self._config_save_after_id = None
+        self._config_write_lock = threading.Lock()
+        # Bytes currently on disk, so saving an unchanged config skips the write
+        self._config_written = None
+        
         try:
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    # Merge with defaults
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
+            raw = CONFIG_PATH.read_bytes()
+            config = _json_loads(raw)
+            self._config_written = raw
+            # Merge with defaults
+            for key, value in default_config.items():
+                if key not in config:
+                    config[key] = value
+            return config
         except Exception:
+            # Missing (first run) or unreadable: fall back to the defaults
             pass
         
         return default_config
     
-    def _save_config(self):
-        """Save application configuration."""
-        config_path = Path.home() / ".simple_ytdl" / "config.json"
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+    def _schedule_save_config(self):
+        """Save the configuration shortly, coalescing changes made in quick succession."""
+        self._config_dirty = True
+        if self._config_save_after_id is not None:
+            self.root.after_cancel(self._config_save_after_id)
+        self._config_save_after_id = self.root.after(500, self._flush_config)
+    
+    def _flush_config(self):
+        """Write pending configuration changes on a background thread."""
+        self._config_save_after_id = None
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
         
+        # Write a snapshot so later edits on the Tk thread can't race the dump
+        snapshot = dict(self.config)
+        self._bg_executor.submit(self._write_config, snapshot)
+    
+    def _write_config(self, config: dict):
+        """Write the configuration to disk."""
+        # Encode up front so the file is written in one call, then swap a temp file
+        # into place so an interrupted write never truncates the existing config
+        temp_path = CONFIG_PATH.with_suffix('.json.tmp')
         try:
-            with open(config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            data = _json_dumps_indented(config)
+            with self._config_write_lock:
+                if data == self._config_written:
+                    return
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, CONFIG_PATH)
+                self._config_written = data
         except Exception:
             pass
     
     def _setup_ui(self):
         """Setup the main UI."""
         self.root.grid_columnconfigure(0, weight=0)
-        self.root.grid_columnconfigure(1, weight=1)
+        # The content column keeps a floor width instead of a fixed, non-propagating frame
+        self.root.grid_columnconfigure(1, weight=1, minsize=900)
         self.root.grid_rowconfigure(0, weight=1)
 
         # Sidebar (increased width for better proportions)
@@ -181,12 +280,12 @@ class BigGayDownloader:
             self._add_conversion_job_to_queue
         )
         self.sidebar.set_update_callback(self._handle_update_button_click)
+        self.sidebar.set_add_jobs_callback(self._add_jobs_to_queue)
         self.sidebar.grid(row=0, column=0, sticky="ns", padx=(32, 0), pady=32)
 
         # Main content area (increased width for better balance)
-        self.main_content = ctk.CTkFrame(self.root, width=1000)
+        self.main_content = ctk.CTkFrame(self.root)
         self.main_content.grid(row=0, column=1, sticky="nsew", padx=(32, 32), pady=32)
-        self.main_content.grid_propagate(False)
         self.main_content.columnconfigure(0, weight=1)
         self.main_content.rowconfigure(0, weight=1)
         self.main_content.rowconfigure(1, weight=1)
@@ -222,8 +321,6 @@ class BigGayDownloader:
     
     def _show_installation_dialog(self):
         """Show installation dialog for first launch."""
-        from tkinter import messagebox
-        
         result = messagebox.askyesno(
             "Welcome to Big Gay Downloader",
             "This is your first time running the application.\n\n"
@@ -243,6 +340,8 @@ class BigGayDownloader:
     
     def _install_yt_dlp_on_first_launch(self):
         """Install yt-dlp on first launch."""
+        from core.yt_dlp_installer import InstallerStatus
+        
         def progress_callback(status: InstallerStatus, progress: float, message: str):
             # Update status in the main window title
             self.root.title(f"Big Gay Downloader - Installing yt-dlp... {progress:.1f}%")
@@ -262,41 +361,43 @@ class BigGayDownloader:
                 )
             else:
                 self.root.title("Big Gay Downloader")
-                print('ERROR: Installation Failed')
-                traceback.print_exc()
+                log.error('Installation Failed')
                 messagebox.showerror("Installation Failed", f"Failed to install yt-dlp:\n\n{message}")
         
         self.first_launch_manager.install_yt_dlp_async(progress_callback, completion_callback)
     
     def _check_for_updates_background(self):
         """Check for yt-dlp updates in the background."""
-        def check_updates():
-            try:
-                update_info = self.first_launch_manager.check_for_updates()
-                if update_info.get("update_available", False):
-                    # Show update notification in main thread
-                    self.root.after(0, self._show_update_notification, update_info)
-            except Exception as e:
-                print(f"[DEBUG] Background update check failed: {e}")
-        
-        # Run in background thread
-        import threading
-        thread = threading.Thread(target=check_updates, daemon=True)
-        thread.start()
+        self._bg_executor.submit(self._do_update_check)
+    
+    def _do_update_check(self):
+        """Run the update check on the background executor."""
+        try:
+            update_info = self.first_launch_manager.check_for_updates()
+            if update_info.get("update_available", False):
+                # Show update notification in main thread
+                self.root.after_idle(self._show_update_notification, update_info)
+        except Exception as e:
+            log.debug("Background update check failed: %s", e)
     
     def _show_update_notification(self, update_info: dict):
         """Show update notification dialog."""
+        # Only needed once an update is found, so kept off the startup path
+        from ui.update_dialog import UpdateNotificationDialog
+        
         def update_callback():
+            from core.yt_dlp_installer import InstallerStatus
+            
             # Create simple progress and completion callbacks for the update
             def progress_callback(status: InstallerStatus, progress: float, message: str):
-                print(f"Update progress: {progress:.1f}% - {message}")
+                log.debug("Update progress: %.1f%% - %s", progress, message)
             
             def completion_callback(success, message):
                 if success:
-                    print("Update completed successfully")
+                    log.info("Update completed successfully")
                     messagebox.showinfo("Update Complete", f"yt-dlp has been updated successfully!\n\n{message}")
                 else:
-                    print(f"Update failed: {message}")
+                    log.error("Update failed: %s", message)
                     messagebox.showerror("Update Failed", f"Failed to update yt-dlp:\n\n{message}")
             
             self.first_launch_manager.update_yt_dlp_async(progress_callback, completion_callback)
@@ -310,33 +411,53 @@ class BigGayDownloader:
     
     def _handle_update_button_click(self):
         """Handle update button click from sidebar."""
+        # The check hits the network, so run it off the Tk thread; the disabled
+        # button also stops a second check from starting while this one runs
+        self.sidebar.update_button.configure(state="disabled", text="Checking...")
+        self._bg_executor.submit(self._do_manual_update_check)
+    
+    def _do_manual_update_check(self):
+        """Run a user-requested update check on the background executor."""
         try:
             update_info = self.first_launch_manager.check_for_updates()
-            
-            if update_info.get("update_available", False):
-                def update_callback(progress_callback, completion_callback):
-                    self.first_launch_manager.update_yt_dlp_async(progress_callback, completion_callback)
-                
-                UpdateDialog(
-                    self.root,
-                    update_info["current_version"],
-                    update_info["latest_version"]
-                )
-            else:
-                from tkinter import messagebox
-                messagebox.showinfo(
-                    "No Updates Available",
-                    "Your application is up to date!"
-                )
         except Exception as e:
-            from tkinter import messagebox
-            print('ERROR: <context for line 345>')
-            traceback.print_exc()
-            messagebox.showerror(
-                "Update Check Failed",
-                f"Failed to check for updates:\n\n{str(e)}"
+            log.exception('Update check failed')
+            self.root.after_idle(self._show_update_check_error, e)
+        else:
+            self.root.after_idle(self._show_update_check_result, update_info)
+    
+    def _reset_update_button(self):
+        """Re-enable the sidebar update button after a check finishes."""
+        self.sidebar.update_button.configure(state="normal", text="Update yt-dlp")
+    
+    def _show_update_check_result(self, update_info: dict):
+        """Show the outcome of a user-requested update check."""
+        self._reset_update_button()
+        if update_info.get("update_available", False):
+            from ui.update_dialog import UpdateDialog
+            
+            def update_callback(progress_callback, completion_callback):
+                self.first_launch_manager.update_yt_dlp_async(progress_callback, completion_callback)
+            
+            UpdateDialog(
+                self.root,
+                update_info["current_version"],
+                update_info["latest_version"]
+            )
+        else:
+            messagebox.showinfo(
+                "No Updates Available",
+                "Your application is up to date!"
             )
     
+    def _show_update_check_error(self, error: Exception):
+        """Report a failed user-requested update check."""
+        self._reset_update_button()
+        messagebox.showerror(
+            "Update Check Failed",
+            f"Failed to check for updates:\n\n{str(error)}"
+        )
+    
     def _update_sidebar_from_config(self):
         """Update sidebar display with saved configuration."""
         saved_folder = self.config.get("output_folder", "")
@@ -346,9 +467,9 @@ class BigGayDownloader:
     def _on_output_folder_changed(self, new_folder: str):
         """Handle output folder change from sidebar."""
         self.config["output_folder"] = new_folder
-        self._save_config()
+        self._schedule_save_config()
     
-    def _add_conversion_job_to_queue(self, input_path: str, target_format: str, output_folder: str):
+    def _add_conversion_job_to_queue(self, input_path: str, target_format: str, output_folder: str) -> AddResult:
         """
         Add a conversion job to the conversion queue.
         
@@ -356,37 +477,44 @@ class BigGayDownloader:
             input_path: Path to the input file
             target_format: Target format ('mp4' or 'mp3')
             output_folder: Output folder path
+            
+        Returns:
+            ADDED if queued, DUPLICATE if already waiting, REJECTED if the queue refused it
         """
         # Create conversion job
         job = ConversionJob(
             input_path=input_path,
             target_format=target_format,
             output_folder=output_folder,
-            title=os.path.basename(input_path)
+            title=PurePath(input_path).name
         )
         
+        # The same file and format is already waiting to be converted
+        if self.conversion_queue_view.contains(job):
+            log.debug("Conversion already queued, skipping: %s", input_path)
+            return AddResult.DUPLICATE
+        
         # Check if queue is full
         if self.conversion_queue.is_queue_full():
-            print('ERROR: Conversion queue full')
-            traceback.print_exc()
+            log.error('Conversion queue full')
             messagebox.showerror("Queue Full", f"Conversion queue is full (maximum {self.conversion_queue.get_queue_capacity()} jobs). Please wait for some conversions to complete.")
-            return
+            return AddResult.REJECTED
         
         # Add to conversion queue view
         self.conversion_queue_view.add_job(job)
         
         # Add to conversion queue
         if not self.conversion_queue.add_job(job):
-            print('ERROR: Failed to add conversion job to queue')
-            traceback.print_exc()
+            log.error('Failed to add conversion job to queue')
             messagebox.showerror("Error", "Failed to add conversion job to queue")
-            return
+            return AddResult.REJECTED
         
-        print(f"Conversion job added successfully. Queue size: {self.conversion_queue.get_queue_size()}")
+        log.debug("Conversion job added successfully. Queue size: %s", self.conversion_queue.get_queue_size())
         
         # Check if conversions are currently running
         if not self.conversions_running:
-            print("[DEBUG] Conversions not running - user must click 'Start Conversions' to begin")
+            log.debug("Conversions not running - user must click 'Start Conversions' to begin")
+        return AddResult.ADDED
     
     def _cancel_conversion_job(self, job: ConversionJob):
         """Cancel a conversion job."""
@@ -394,53 +522,54 @@ class BigGayDownloader:
             # Update display
             self.conversion_queue_view.update_job(job)
         else:
-            print('ERROR: Failed to cancel conversion job')
-            traceback.print_exc()
+            log.error('Failed to cancel conversion job')
             messagebox.showerror("Error", "Failed to cancel conversion job")
     
     def _remove_conversion_job_from_queue(self, job: ConversionJob):
         """Remove a conversion job from the conversion queue."""
+        self._last_ui_push.pop(id(job), None)
+        
         # Check if job is currently being processed
         if self.conversion_queue.is_job_processing(job):
-            print(f"[DEBUG] Conversion job {job.title} is currently being processed, will be cancelled")
+            log.debug("Conversion job %s is currently being processed, will be cancelled", job.title)
         
         # Remove the job from the queue
         if self.conversion_queue.remove_job(job):
-            print(f"[DEBUG] Successfully removed/cancelled conversion job: {job.title}")
+            log.debug("Successfully removed/cancelled conversion job: %s", job.title)
         else:
-            print(f"[DEBUG] Failed to remove conversion job from queue: {job.title}")
+            log.debug("Failed to remove conversion job from queue: %s", job.title)
     
     def _start_conversions(self):
-        print(f"[DEBUG] _start_conversions called. conversions_running: {self.conversions_running}")
+        log.debug("_start_conversions called. conversions_running: %s", self.conversions_running)
         if not self.conversions_running:
             self.conversions_running = True
-            print("[DEBUG] Starting/resuming conversion queue")
+            log.debug("Starting/resuming conversion queue")
             self.conversion_queue_view.start_button.configure(state="disabled")
             self.conversion_queue.start()  # This will start or resume the queue
         else:
-            print("[DEBUG] Conversions already running, ignoring start request")
+            log.debug("Conversions already running, ignoring start request")
     
     def _convert_job(self, job: ConversionJob):
         """Convert a job using the file converter."""
         try:
-            print(f"Starting conversion for job: {job.title}")
+            log.info("Starting conversion for job: %s", job.title)
             
             # Update job status
             job.status = ConversionStatus.CONVERTING
+            self._post_job_update(job)
             
             # Create progress callback
             def conversion_progress(progress: float):
                 # Update job progress
                 job.progress = progress
-                # Update UI in main thread
-                self.root.after(0, lambda: self.conversion_queue_view.update_job(job))
+                # Redrawn on the main thread
+                self._post_job_progress(job)
             
             # Extract custom filename if job has output_path set
             custom_filename = None
             if job.output_path:
-                custom_filename = os.path.basename(job.output_path)
-                # Remove extension if present to let converter add the correct one
-                custom_filename = os.path.splitext(custom_filename)[0]
+                # Drop the extension to let the converter add the correct one
+                custom_filename = PurePath(job.output_path).stem
             
             # Start conversion with custom filename
             output_path = self.file_converter.convert_file(
@@ -452,194 +581,207 @@ class BigGayDownloader:
             job.output_path = output_path
             job.status = ConversionStatus.COMPLETED
             job.progress = 100.0
-            print(f"Conversion completed for job: {job.title}")
+            log.info("Conversion completed for job: %s", job.title)
             
         except Exception as e:
-            print(f"Conversion failed for job {job.title}: {e}")
+            log.error("Conversion failed for job %s: %s", job.title, e)
             job.status = ConversionStatus.FAILED
             job.error_message = safe_error_message(e)
         finally:
-            # Check if queue is empty and pause if so
-            if self.conversion_queue.get_queue_size() == 0:
-                print("[DEBUG] Conversion queue empty, pausing conversions")
+            self._last_ui_push.pop(id(job), None)
+            self._post_job_update(job)
+            
+            # Pause once the queue is empty and no other conversion is still running;
+            # decided by the queue under its own lock so a just-claimed job counts
+            if self.conversion_queue.pause_if_idle(job):
+                log.debug("Conversion queue empty, pausing conversions")
                 self.conversions_running = False
-                self.conversion_queue.pause()  # Pause the queue instead of stopping
-                self.conversion_queue_view.start_button.configure(state="normal")
+                # Runs on a worker thread; re-enable the button from the Tk thread
+                self.root.after_idle(lambda: self.conversion_queue_view.start_button.configure(state="normal"))
     
-    def _convert_file(self, input_path: str, target_format: str, output_folder: str):
-        """
-        Convert a file to the specified format with maximum compatibility.
-        
-        Args:
-            input_path: Path to the input file
-            target_format: Target format ('mp4' or 'mp3')
-            output_folder: Output folder path
-        """
-        def conversion_progress(progress: float):
-            """Update conversion progress in the UI."""
-            # This could be enhanced to show progress in the UI
-            print(f"[DEBUG] Conversion progress: {progress:.1f}%")
-        
+    def _setup_ui_events(self):
+        """Setup event-driven job redraws fed from the worker threads."""
+        # Jobs waiting to be redrawn; drained on the Tk thread by <<JobUpdate>>
+        self._ui_events = queue.SimpleQueue()
+        self._ui_pending = False
+        self._ui_pending_lock = threading.Lock()
+        # When each running job's progress was last queued, keyed by id(job)
+        self._last_ui_push = {}
+        self.root.bind('<<JobUpdate>>', self._drain_ui_events)
+    
+    def _post_job_update(self, job):
+        """Queue a job for redraw. Safe to call from any thread."""
+        if isinstance(job, DownloadJob):
+            # Swap in a consistent snapshot for the Tk thread to draw
+            job.publish_ui_state()
+        self._ui_events.put(job)
+        with self._ui_pending_lock:
+            if self._ui_pending:
+                return
+            self._ui_pending = True
         try:
-            # Run conversion in a separate thread to avoid blocking the UI
-            def run_conversion():
-                try:
-                    output_path = self.file_converter.convert_file(
-                        input_path, target_format, output_folder, conversion_progress
-                    )
-                    
-                    # Show success message in main thread
-                    self.root.after(0, lambda: messagebox.showinfo(
-                        "Conversion Complete",
-                        f"File successfully converted to {target_format.upper()}!\n\nOutput: {os.path.basename(output_path)}"
-                    ))
-                    
-                except Exception as e:
-                    # Show error message in main thread
-                    self.root.after(0, lambda: messagebox.showerror(
-                        "Conversion Failed",
-                        f"Failed to convert file: {safe_error_message(e)}"
-                    ))
-            
-            # Start conversion thread
-            conversion_thread = threading.Thread(target=run_conversion, daemon=True)
-            conversion_thread.start()
-            
+            # One event per batch: only the first update after a drain wakes the Tk loop
+            self.root.event_generate('<<JobUpdate>>', when='tail')
         except Exception as e:
-            messagebox.showerror(
-                "Conversion Error",
-                f"Failed to start conversion: {safe_error_message(e)}"
-            )
+            # The window is already gone during shutdown
+            log.debug("Could not post job update: %s", e)
     
-    def _setup_ui_updates(self):
-        """Setup periodic UI updates with adaptive frequency."""
-        def update_ui():
-            # Update download queue view for all jobs
-            active_jobs = [job for job in self.download_queue_view.jobs if job.status == JobStatus.DOWNLOADING]
-            
-            # Adaptive update frequency: faster when downloading, slower when idle
-            if active_jobs:
-                # Active downloads: update every 100ms
-                update_interval = 100
-                # Update all jobs
-                for job in self.download_queue_view.jobs:
-                    self.download_queue_view.update_job(job)
-            else:
-                # Idle: update every 500ms
-                update_interval = 500
-                # Update jobs that might have changed (including completed ones)
-                for job in self.download_queue_view.jobs:
-                    if job.status in [JobStatus.PENDING, JobStatus.COMPLETED, JobStatus.FAILED]:
-                        self.download_queue_view.update_job(job)
-            
-            # Update conversion queue view
-            active_conversions = [job for job in self.conversion_queue_view.jobs if job.status == ConversionStatus.CONVERTING]
-            if active_conversions:
-                # Active conversions: update all jobs
-                for job in self.conversion_queue_view.jobs:
-                    self.conversion_queue_view.update_job(job)
-            else:
-                # Idle: update jobs that might have changed (including completed ones)
-                for job in self.conversion_queue_view.jobs:
-                    if job.status in [ConversionStatus.PENDING, ConversionStatus.COMPLETED, ConversionStatus.FAILED]:
-                        self.conversion_queue_view.update_job(job)
-            
-            # Periodically clean up completed jobs (every 10 seconds)
-            self._cleanup_counter += 1
-            
-            if self._cleanup_counter >= 100:  # 100 * 100ms = 10 seconds
-                # Note: cleanup_completed_jobs was removed - jobs are now manually cleared
-                self._cleanup_counter = 0
-            
-            # Schedule next update with adaptive interval
-            self.root.after(update_interval, update_ui)
+    def _post_job_progress(self, job):
+        """Queue a progress redraw, at most 10 times a second per job (100% always goes through)."""
+        now = time.monotonic()
+        if job.progress < 100.0 and now - self._last_ui_push.get(id(job), 0.0) < 0.1:
+            return
+        self._last_ui_push[id(job)] = now
+        self._post_job_update(job)
+    
+    def _drain_ui_events(self, event=None):
+        """Redraw every queued job in one pass, once per unique job."""
+        with self._ui_pending_lock:
+            self._ui_pending = False
+        
+        # Take only what's queued now; anything posted meanwhile raises a new event
+        batch = {}
+        for _ in range(self._ui_events.qsize()):
+            try:
+                job = self._ui_events.get_nowait()
+            except queue.Empty:
+                break
+            batch[id(job)] = job
+        
+        # Reconfigure all dirty cards back-to-back so Tk repaints them in a single idle pass
+        for job in batch.values():
+            self._redraw_job(job)
+    
+    def _redraw_job(self, job):
+        """Redraw a job's card; the card itself skips the redraw if nothing visible changed."""
+        if isinstance(job, ConversionJob):
+            self.conversion_queue_view.update_job(job)
+            return
         
-        # Start UI updates
-        self.root.after(100, update_ui)
+        # Download jobs carry an immutable published state to draw from
+        state = job.ui_state
+        if state is None:
+            state = job.publish_ui_state()
+        self.download_queue_view.update_job(job, state)
     
-    def _add_job_to_queue(self, job: DownloadJob):
+    def _add_job_to_queue(self, job: DownloadJob) -> AddJobsResult:
         """Add a job to the download queue."""
-        print(f"Adding job to queue: {job.url} - {job.title}")
+        return self._add_jobs_to_queue([job])
+    
+    def _add_jobs_to_queue(self, jobs: List[DownloadJob]) -> AddJobsResult:
+        """
+        Add jobs to the download queue, updating the view and config once per batch.
         
-        # Check if queue is full
-        if self.download_queue.is_queue_full():
-            print('ERROR: Download queue full')
-            traceback.print_exc()
-            messagebox.showerror("Queue Full", f"Download queue is full (maximum {self.download_queue.get_queue_capacity()} jobs). Please wait for some downloads to complete.")
-            return
+        Returns:
+            How many jobs were queued, skipped as duplicates, or rejected by a full queue
+        """
+        accepted = []
+        duplicates = 0
+        batch_keys = set()
+        for job in jobs:
+            log.debug("Adding job to queue: %s - %s", job.url, job.title)
+            
+            # Re-adding something already waiting (e.g. a repeated playlist add) is a no-op
+            key = job.dedupe_key
+            if key in batch_keys or self.download_queue_view.contains(job):
+                log.debug("Job already queued, skipping: %s", job.url)
+                duplicates += 1
+                continue
+            
+            # Check if queue is full
+            if self.download_queue.is_queue_full():
+                log.error('Download queue full')
+                messagebox.showerror("Queue Full", f"Download queue is full (maximum {self.download_queue.get_queue_capacity()} jobs). Please wait for some downloads to complete.")
+                break
+            
+            # Add to download queue
+            if not self.download_queue.add_job(job):
+                log.error('Failed to add job to queue')
+                messagebox.showerror("Error", "Failed to add job to queue")
+                break
+            
+            batch_keys.add(key)
+            accepted.append(job)
         
-        # Add to download queue view
-        self.download_queue_view.add_job(job)
+        # Everything from the point the queue refused a job onwards was not added
+        result = AddJobsResult(len(accepted), duplicates, len(jobs) - len(accepted) - duplicates)
+        if not accepted:
+            return result
         
-        # Add to download queue
-        if not self.download_queue.add_job(job):
-            print('ERROR: Failed to add job to queue')
-            traceback.print_exc()
-            messagebox.showerror("Error", "Failed to add job to queue")
-            return
+        # Add to download queue view in one pass
+        self.download_queue_view.add_jobs(accepted)
         
-        # Defensive: Always pause the queue after adding a job
+        # Defensive: Always pause the queue after adding jobs
         self.download_queue.pause()
         
-        print(f"Job added successfully. Queue size: {self.download_queue.get_queue_size()}")
+        log.debug("Jobs added successfully. Queue size: %s", self.download_queue.get_queue_size())
         
         # Check if downloads are currently running
         if not self.downloads_running:
-            print("[DEBUG] Downloads not running - user must click 'Start Downloads' to begin")
+            log.debug("Downloads not running - user must click 'Start Downloads' to begin")
         
         # Update configuration and sidebar with the new output folder
-        self.config["output_folder"] = job.output_folder
-        self.sidebar.set_output_folder(job.output_folder)
-        self._save_config()
+        output_folder = accepted[-1].output_folder
+        self.config["output_folder"] = output_folder
+        self.sidebar.set_output_folder(output_folder)
+        self._schedule_save_config()
         
         # Jobs will only start when user clicks "Start Downloads" button
         # The download queue is paused until explicitly resumed
+        return result
     
     def _cancel_job(self, job: DownloadJob):
         """Cancel a download job."""
         if self.download_queue.cancel_job(job):
-            # Update display
-            self.download_queue_view.update_job(job)
+            # Update display from a freshly published state
+            self._post_job_update(job)
         else:
-            print('ERROR: Failed to cancel job')
-            traceback.print_exc()
+            log.error('Failed to cancel job')
             messagebox.showerror("Error", "Failed to cancel job")
     
     def _remove_job_from_queue(self, job: DownloadJob):
         """Remove a job from the download queue."""
+        self._last_ui_push.pop(id(job), None)
+        
         # Check if job is currently being processed
         if self.download_queue.is_job_processing(job):
-            print(f"[DEBUG] Job {job.url} is currently being processed, will be cancelled")
+            log.debug("Job %s is currently being processed, will be cancelled", job.url)
         
         # Remove the job from the queue
         if self.download_queue.remove_job(job):
-            print(f"[DEBUG] Successfully removed/cancelled job: {job.url}")
+            log.debug("Successfully removed/cancelled job: %s", job.url)
         else:
-            print(f"[DEBUG] Failed to remove job from download queue: {job.url}")
+            log.debug("Failed to remove job from download queue: %s", job.url)
     
     def _start_downloads(self):
-        print(f"[DEBUG] _start_downloads called. downloads_running: {self.downloads_running}")
+        log.debug("_start_downloads called. downloads_running: %s", self.downloads_running)
         if not self.downloads_running:
             self.downloads_running = True
-            print("[DEBUG] Starting/resuming download queue")
+            log.debug("Starting/resuming download queue")
             self.download_queue_view.start_button.configure(state="disabled")
             self.download_queue.start()  # This will start or resume the queue
         else:
-            print("[DEBUG] Downloads already running, ignoring start request")
+            log.debug("Downloads already running, ignoring start request")
     
     def _download_job(self, job: DownloadJob):
         """Download a job using the downloader."""
         try:
-            print(f"Starting download for job: {job.url}")
+            log.info("Starting download for job: %s", job.url)
             
             # Update job status
             job.status = JobStatus.DOWNLOADING
+            self._post_job_update(job)
+            
+            # Checked once per job rather than on every progress line
+            debug_progress = log.isEnabledFor(logging.DEBUG)
             
             # Create progress callback
             def progress_callback(updated_job):
                 # This will be called from the downloader thread
-                # We'll update the UI in the main thread
-                print(f"Progress update: {updated_job.progress:.1f}% - {updated_job.speed or 'N/A'}")
+                # The card is redrawn on the main thread
+                if debug_progress:
+                    log.debug("Progress update: %.1f%% - %s", updated_job.progress, updated_job.speed or 'N/A')
+                self._post_job_progress(updated_job)
             
             # Start download
             self.downloader.download_with_retry(job, progress_callback)
@@ -647,19 +789,23 @@ class BigGayDownloader:
             # Set status to completed if download succeeded
             job.status = JobStatus.COMPLETED
             job.progress = 100.0
-            print(f"Download completed for job: {job.url}")
+            log.info("Download completed for job: %s", job.url)
             
         except Exception as e:
-            print(f"Download failed for job {job.url}: {e}")
+            log.error("Download failed for job %s: %s", job.url, e)
             job.status = JobStatus.FAILED
             job.error_message = safe_error_message(e)
         finally:
-            # Check if queue is empty and pause if so
-            if self.download_queue.get_queue_size() == 0:
-                print("[DEBUG] Queue empty, pausing downloads")
+            self._last_ui_push.pop(id(job), None)
+            self._post_job_update(job)
+            
+            # Pause once the queue is empty and no other download is still running;
+            # decided by the queue under its own lock so a just-claimed job counts
+            if self.download_queue.pause_if_idle(job):
+                log.debug("Queue empty, pausing downloads")
                 self.downloads_running = False
-                self.download_queue.pause()  # Pause the queue instead of stopping
-                self.download_queue_view.start_button.configure(state="normal")
+                # Runs on a worker thread; re-enable the button from the Tk thread
+                self.root.after_idle(lambda: self.download_queue_view.start_button.configure(state="normal"))
     
     def _on_closing(self):
         """Handle application closing."""
@@ -672,8 +818,14 @@ class BigGayDownloader:
         # Clean up subprocesses
         self.downloader.cleanup_subprocesses()
         
-        # Save configuration
-        self._save_config()
+        # Save configuration now; a pending debounced save would never run
+        if self._config_save_after_id is not None:
+            self.root.after_cancel(self._config_save_after_id)
+            self._config_save_after_id = None
+        self._write_config(dict(self.config))
+        
+        # Stop taking background work; anything still running dies with the process
+        self._bg_executor.shutdown(wait=False)
         
         # Close window
         self.root.destroy()
@@ -685,14 +837,13 @@ class BigGayDownloader:
 
 def main():
     """Main entry point."""
+    # Debug output is off by default; lower the level to trace queue activity
+    logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(message)s")
     try:
         app = BigGayDownloader()
         app.run()
     except Exception as e:
-        import traceback
-        print('ERROR: Exception in main loop')
-        traceback.print_exc()
-        import sys
+        log.exception('Exception in main loop')
         sys.stderr.flush()
         messagebox.showerror("Error", safe_error_message(e))
 
@@ -2,9 +2,17 @@
 Basic tests for YouTube Downloader core functionality.
 """
 
+import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
-from core.utils import is_valid_url, sanitize_filename
-from core.queue import DownloadJob, JobStatus
+from unittest import mock
+from urllib.parse import urlparse
+from core.utils import is_valid_url, sanitize_filename, sanitize_url, _sanitize_filename_internal, _INVALID_FILENAME_CHARS
+from core.queue import DownloadJob, DownloadQueue, JobStatus
+from core.yt_dlp_installer import YtDlpInstaller, _backup_number
 
 
 class TestUtils(unittest.TestCase):
@@ -23,6 +31,45 @@ class TestUtils(unittest.TestCase):
         self.assertFalse(is_valid_url("not a url"))
         self.assertFalse(is_valid_url("https://example.com/video"))
     
+    def test_sanitize_url(self):
+        """Test URL sanitization accepts supported URLs and rejects everything else."""
+        self.assertEqual(sanitize_url("  https://www.youtube.com/watch?v=dQw4w9WgXcQ  "),
+                         "https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        self.assertEqual(sanitize_url("https://youtu.be/dQw4w9WgXcQ"), "https://youtu.be/dQw4w9WgXcQ")
+        self.assertEqual(sanitize_url("https://www.xvideos.com/video123/title", "xvideos"),
+                         "https://www.xvideos.com/video123/title")
+        
+        rejected = [
+            # Non-http schemes
+            ("ftp://www.youtube.com/watch?v=dQw4w9WgXcQ", "youtube"),
+            ("file:///etc/passwd?youtu", "youtube"),
+            ("javascript:alert('youtube')", "youtube"),
+            ("www.youtube.com/watch?v=dQw4w9WgXcQ", "youtube"),
+            # Unsupported hosts, including ones that pass the substring prefilter
+            ("https://example.com/video", "youtube"),
+            ("https://notyoutube.com/watch?v=dQw4w9WgXcQ", "youtube"),
+            ("https://youtube.com.evil.example/watch?v=dQw4w9WgXcQ", "youtube"),
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "xvideos"),
+            ("https://xvideos.example.com/video123", "xvideos"),
+            # Shell metacharacters caught by the dangerous-pattern scan
+            ("https://www.youtube.com/watch?v=abc;rm -rf /", "youtube"),
+            ("https://www.youtube.com/watch?v=abc&&whoami", "youtube"),
+            ("https://www.youtube.com/watch?v=$(whoami)", "youtube"),
+            ("https://www.youtube.com/watch?v=`id`", "youtube"),
+            ("https://www.youtube.com/watch?v=abc|cat", "youtube"),
+            ("https://www.xvideos.com/video123/<script>", "xvideos"),
+            # Missing video ID, unknown mode
+            ("https://www.youtube.com/feed", "youtube"),
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "vimeo"),
+        ]
+        for url, mode in rejected:
+            with self.subTest(url=url, mode=mode):
+                with self.assertRaises(ValueError):
+                    sanitize_url(url, mode)
+        
+        with self.assertRaisesRegex(ValueError, "dangerous pattern: &&"):
+            sanitize_url("https://www.youtube.com/watch?v=abc&&whoami")
+    
     def test_sanitize_filename(self):
         """Test filename sanitization."""
         # Test invalid characters (there are 8 invalid chars: < > : " / \ | ? *)
@@ -39,6 +86,20 @@ class TestUtils(unittest.TestCase):
         long_name = "a" * 300
         sanitized = sanitize_filename(long_name)
         self.assertLessEqual(len(sanitized), 200)
+    
+    def test_sanitize_filename_fast_path(self):
+        """Names returned untouched by the fast path match the full translate/strip/truncate result."""
+        def slow_path(filename):
+            return filename.translate(_INVALID_FILENAME_CHARS).strip(' .')[:200] or 'untitled'
+        
+        names = [
+            "Never Gonna Give You Up", "video.mp4", "a", "CON", "nul.txt", "COM1", "LPT9.mp3",
+            "trailing dot.", "trailing space ", " leading space", ".hidden", "dots...", "..",
+            "a:b", "what?", "tab\tinside", "ünïcödé 🎵", "x" * 200, "x" * 201, "x" * 199 + ".",
+        ]
+        for name in names:
+            with self.subTest(name=name):
+                self.assertEqual(_sanitize_filename_internal(name), slow_path(name))
 
 
 class TestDownloadJob(unittest.TestCase):
@@ -62,6 +123,168 @@ class TestDownloadJob(unittest.TestCase):
         self.assertIsNone(job.eta)
         self.assertIsNone(job.speed)
         self.assertIsNone(job.progress_widgets)
+    
+    def test_dedupe_key_includes_compatibility_mode(self):
+        """A compatibility-mode re-download of the same URL is not a duplicate."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        job = DownloadJob(url=url, format="mp4", output_folder="/tmp")
+        same = DownloadJob(url=url, format="mp4", output_folder="/tmp", title="renamed")
+        compatible = DownloadJob(url=url, format="mp4", output_folder="/tmp", compatibility_mode=True)
+        self.assertEqual(job.dedupe_key, same.dedupe_key)
+        self.assertNotEqual(job.dedupe_key, compatible.dedupe_key)
+
+
+class TestDownloadQueueScheduling(unittest.TestCase):
+    """Test how many jobs the download queue runs at once."""
+    
+    def _run_jobs(self, urls, **queue_kwargs):
+        """Run one job per URL and return the peak overall and per-host concurrency."""
+        lock = threading.Lock()
+        active = {}
+        peaks = {"total": 0}
+        
+        def download(job):
+            host = urlparse(job.url).netloc
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peaks["total"] = max(peaks["total"], sum(active.values()))
+                peaks[host] = max(peaks.get(host, 0), active[host])
+            time.sleep(0.1)
+            with lock:
+                active[host] -= 1
+        
+        download_queue = DownloadQueue(download, **queue_kwargs)
+        jobs = [DownloadJob(url=url, format="mp4", output_folder="/tmp") for url in urls]
+        for job in jobs:
+            self.assertTrue(download_queue.add_job(job))
+        download_queue.start()
+        try:
+            deadline = time.monotonic() + 10
+            while any(job.status != JobStatus.COMPLETED for job in jobs):
+                self.assertLess(time.monotonic(), deadline, "jobs did not finish")
+                time.sleep(0.01)
+        finally:
+            download_queue.stop()
+        return peaks
+    
+    def test_max_concurrent(self):
+        """No more than max_concurrent jobs run at once, and the pool is used."""
+        urls = [f"https://www.youtube.com/watch?v={i}" for i in range(6)]
+        peaks = self._run_jobs(urls, max_concurrent=3)
+        self.assertEqual(peaks["total"], 3)
+    
+    def test_max_per_host(self):
+        """A busy host doesn't take every worker."""
+        urls = [f"https://www.youtube.com/watch?v={i}" for i in range(4)]
+        urls += [f"https://www.xvideos.com/video{i}" for i in range(2)]
+        peaks = self._run_jobs(urls, max_concurrent=3, max_per_host=2)
+        self.assertEqual(peaks["www.youtube.com"], 2)
+        self.assertLessEqual(peaks["www.xvideos.com"], 2)
+        self.assertEqual(peaks["total"], 3)
+    
+    def test_pause_if_idle(self):
+        """The queue only pauses once nothing is waiting or running."""
+        download_queue = DownloadQueue(lambda job: None)
+        download_queue.resume()
+        job = DownloadJob(url="https://youtu.be/dQw4w9WgXcQ", format="mp4", output_folder="/tmp")
+        download_queue.add_job(job)
+        self.assertFalse(download_queue.pause_if_idle())
+        self.assertFalse(download_queue.is_paused())
+        download_queue.clear_queue()
+        self.assertTrue(download_queue.pause_if_idle())
+        self.assertTrue(download_queue.is_paused())
+
+
+class TestYtDlpInstaller(unittest.TestCase):
+    """Test yt-dlp installer helpers that don't touch the network."""
+    
+    def setUp(self):
+        self.app_data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.app_data_dir, ignore_errors=True)
+        self.installer = YtDlpInstaller(self.app_data_dir)
+    
+    def test_compare_versions_numeric(self):
+        """Plain CalVer versions compare numerically, not as strings."""
+        compare = self.installer._compare_versions
+        self.assertEqual(compare("2024.08.06", "2024.08.06"), 0)
+        self.assertEqual(compare("2024.8.6", "2024.08.06"), 0)
+        self.assertEqual(compare("2024.08.06", "2024.10.22"), -1)
+        self.assertEqual(compare("2024.08.06.232843", "2024.08.06"), 1)
+    
+    def test_compare_versions_prerelease(self):
+        """Dev and pre-release suffixes fall back to PEP 440 ordering."""
+        compare = self.installer._compare_versions
+        self.assertEqual(compare("2024.08.06.dev0", "2024.08.06"), -1)
+        self.assertEqual(compare("2024.08.06rc1", "2024.08.06"), -1)
+        self.assertEqual(compare("2024.08.06.dev0", "2024.08.06rc1"), -1)
+        self.assertEqual(compare("2024.08.06", "2024.08.07.dev0"), -1)
+        self.assertEqual(compare("2024.08.07.dev0", "2024.08.06"), 1)
+    
+    def _touch_backup(self, name):
+        path = os.path.join(self.installer.backup_dir, name)
+        with open(path, "wb"):
+            pass
+        return path
+    
+    def test_backup_number(self):
+        """Backup numbers are parsed from both naming schemes."""
+        self.assertEqual(_backup_number("/x/yt-dlp_backup_000042.exe"), 42)
+        self.assertEqual(_backup_number("/x/yt-dlp_backup_1700000000.exe"), 1700000000)
+        self.assertEqual(_backup_number("/x/yt-dlp_backup_broken.exe"), 0)
+    
+    def test_scan_backups_order(self):
+        """Backups are listed oldest first; sequential ones sort after legacy timestamp names."""
+        legacy = ["yt-dlp_backup_1699999999.exe", "yt-dlp_backup_1700000000.exe"]
+        for name in reversed(legacy):
+            self._touch_backup(name)
+        self._touch_backup("unrelated.exe")
+        self.installer._backups = self.installer._scan_backups()
+        
+        # A sequentially numbered backup made by the current scheme
+        current = os.path.join(self.app_data_dir, "yt-dlp.exe")
+        with open(current, "wb") as f:
+            f.write(b"binary")
+        with mock.patch.object(self.installer, "get_yt_dlp_path", return_value=current):
+            self.assertTrue(self.installer._create_backup())
+        sequential = os.path.basename(self.installer._backups[-1])
+        self.assertNotIn(sequential, legacy)
+        
+        # A fresh scan of the directory puts it after every legacy backup
+        rescanned = [os.path.basename(path) for path in YtDlpInstaller(self.app_data_dir)._scan_backups()]
+        self.assertEqual(rescanned, legacy + [sequential])
+    
+    def test_scan_backups_numeric_order(self):
+        """Sequence numbers sort numerically, not by name."""
+        for name in ("yt-dlp_backup_000010.exe", "yt-dlp_backup_000009.exe", "yt-dlp_backup_0000100.exe"):
+            self._touch_backup(name)
+        scanned = [_backup_number(path) for path in self.installer._scan_backups()]
+        self.assertEqual(scanned, [9, 10, 100])
+    
+    def test_create_backup_continues_numbering(self):
+        """A new backup is numbered after the highest existing one."""
+        self._touch_backup("yt-dlp_backup_1700000000.exe")
+        self.installer._backups = self.installer._scan_backups()
+        current = os.path.join(self.app_data_dir, "yt-dlp.exe")
+        with open(current, "wb") as f:
+            f.write(b"binary")
+        with mock.patch.object(self.installer, "get_yt_dlp_path", return_value=current):
+            self.assertTrue(self.installer._create_backup())
+            self.assertTrue(self.installer._create_backup())
+        self.assertEqual(
+            [os.path.basename(path) for path in self.installer._backups],
+            ["yt-dlp_backup_1700000000.exe", "yt-dlp_backup_1700000001.exe", "yt-dlp_backup_1700000002.exe"],
+        )
+        self.assertEqual(self.installer._backups, self.installer._scan_backups())
+    
+    def test_create_backup_numbering_starts_at_one(self):
+        """Without existing backups, numbering starts at 000001."""
+        current = os.path.join(self.app_data_dir, "yt-dlp.exe")
+        with open(current, "wb") as f:
+            f.write(b"binary")
+        with mock.patch.object(self.installer, "get_yt_dlp_path", return_value=current):
+            self.assertTrue(self.installer._create_backup())
+        self.assertEqual([os.path.basename(path) for path in self.installer._backups],
+                         ["yt-dlp_backup_000001.exe"])
 
 
 if __name__ == "__main__":
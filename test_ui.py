@@ -55,10 +55,7 @@ def test_styles():
                      font=("Segoe UI", 18, "bold"), foreground=text_primary)
     title.pack(pady=(0, 20))
     
-    # Color palette display
-    colors_frame = ttk.Frame(main_frame, style="Test.TFrame")
-    colors_frame.pack(fill="x", pady=(0, 20))
-    
+    # Color palette display, drawn as items on one canvas instead of a frame per swatch
     colors = [
         ("Base", base),
         ("Elevated", elevated),
@@ -71,20 +68,21 @@ def test_styles():
         ("Text Secondary", text_secondary)
     ]
     
+    cell_width, cell_height = 200, 80
+    colors_canvas = tk.Canvas(main_frame, width=cell_width * 3, height=cell_height * 3,
+                              bg=elevated, highlightthickness=0)
+    colors_canvas.pack(pady=(0, 20))
+    
     for i, (name, color) in enumerate(colors):
-        row = i // 3
-        col = i % 3
-        
-        color_frame = ttk.Frame(colors_frame, style="Test.TFrame")
-        color_frame.grid(row=row, column=col, padx=10, pady=5, sticky="ew")
+        x = (i % 3) * cell_width + cell_width // 2
+        y = (i // 3) * cell_height
         
         # Color swatch
-        swatch = tk.Canvas(color_frame, width=60, height=30, bg=color, highlightthickness=0)
-        swatch.pack(pady=(0, 5))
+        colors_canvas.create_rectangle(x - 30, y, x + 30, y + 30, fill=color, outline="")
         
         # Color name
-        label = ttk.Label(color_frame, text=f"{name}\n{color}", style="Test.TLabel", justify="center")
-        label.pack()
+        colors_canvas.create_text(x, y + 35, text=f"{name}\n{color}", fill=text_primary,
+                                  font=("Segoe UI", 12), justify="center", anchor="n")
     
     # Test buttons
     button_frame = ttk.Frame(main_frame, style="Test.TFrame")
@@ -5,12 +5,44 @@ Displays conversion queue with progress bars and status information.
 
 import customtkinter as ctk
 from tkinter import messagebox, simpledialog
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Tuple
+from collections import OrderedDict
 import threading
-import os
+import logging
 
 from core.conversion_queue import ConversionJob, ConversionStatus
 
+log = logging.getLogger("bgd.ui")
+
+# Jobs in these states can still be cancelled
+_CANCELLABLE_STATUSES = frozenset({ConversionStatus.PENDING, ConversionStatus.CONVERTING})
+# Jobs in these states can be put back in the queue
+_RETRIABLE_STATUSES = frozenset({ConversionStatus.FAILED})
+
+# Status indicator glyph and colour for each job status
+_STATUS_STYLES = {
+    ConversionStatus.PENDING: ("⏳", "#fbbf24"),
+    ConversionStatus.CONVERTING: ("��", "#00d4ff"),
+    ConversionStatus.COMPLETED: ("✅", "#4ade80"),
+    ConversionStatus.FAILED: ("❌", "#f87171"),
+}
+
+# Fixed status text; only CONVERTING is formatted per update
+_STATUS_TEXT = {
+    ConversionStatus.PENDING: "Pending",
+    ConversionStatus.COMPLETED: "Completed",
+    ConversionStatus.FAILED: "Failed",
+}
+
+# Fonts shared by every job card
+_CARD_TITLE_FONT = ("Segoe UI", 12, "bold")
+_CARD_DETAIL_FONT = ("Segoe UI", 10)
+
+# Removed cards kept hidden for reuse by later jobs instead of being rebuilt.
+# This is a reuse pool, not virtualization: every listed job still has its own
+# live card, so the widget count grows with the list; only rebuild churn is saved.
+_CARD_POOL_SIZE = 16
+
 
 class ConversionJobCard(ctk.CTkFrame):
     """Individual conversion job card for displaying conversion information."""
@@ -19,6 +51,7 @@ class ConversionJobCard(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         self.job = job
         self.cancel_callback = cancel_callback
+        self._drawn_state = None  # (status, progress) last rendered, to skip no-op redraws
         
         # Create layout
         self.grid_columnconfigure(1, weight=1)
@@ -33,20 +66,20 @@ class ConversionJobCard(ctk.CTkFrame):
         content_frame.grid_columnconfigure(0, weight=1)
         
         # Title
-        self.title_label = ctk.CTkLabel(content_frame, text=job.title or os.path.basename(job.input_path), font=("Segoe UI", 12, "bold"))
+        self.title_label = ctk.CTkLabel(content_frame, text="", font=_CARD_TITLE_FONT)
         self.title_label.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
         
         # Details
         details_frame = ctk.CTkFrame(content_frame)
         details_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
         
-        self.format_label = ctk.CTkLabel(details_frame, text=f"Format: {job.target_format.upper()}", font=("Segoe UI", 10))
+        self.format_label = ctk.CTkLabel(details_frame, text="", font=_CARD_DETAIL_FONT)
         self.format_label.grid(row=0, column=0, sticky="w", padx=5, pady=2)
         
-        self.destination_label = ctk.CTkLabel(details_frame, text=f"Destination: {job.output_folder}", font=("Segoe UI", 10))
+        self.destination_label = ctk.CTkLabel(details_frame, text="", font=_CARD_DETAIL_FONT)
         self.destination_label.grid(row=1, column=0, sticky="w", padx=5, pady=2)
         
-        self.status_text_label = ctk.CTkLabel(details_frame, text="Pending", font=("Segoe UI", 10))
+        self.status_text_label = ctk.CTkLabel(details_frame, text="Pending", font=_CARD_DETAIL_FONT)
         self.status_text_label.grid(row=1, column=1, sticky="w", padx=5, pady=2)
         
         # Progress bar
@@ -58,49 +91,58 @@ class ConversionJobCard(ctk.CTkFrame):
         actions_frame = ctk.CTkFrame(content_frame)
         actions_frame.grid(row=3, column=0, sticky="ew", padx=10, pady=(0, 10))
         
-        self.cancel_button = ctk.CTkButton(actions_frame, text="Cancel", command=lambda: self.cancel_callback(job), width=80)
+        self.cancel_button = ctk.CTkButton(actions_frame, text="Cancel", command=lambda: self.cancel_callback(self.job), width=80)
         self.cancel_button.grid(row=0, column=0, padx=5, pady=5)
         
+        self.set_job(job)
+    
+    def set_job(self, job: ConversionJob):
+        """
+        Point the card at a job and redraw every field, so pooled cards can be reused.
+        
+        Args:
+            job: The conversion job to display
+        """
+        self.job = job
+        self.title_label.configure(text=job.title or job.display_basename)
+        self.format_label.configure(text=f"Format: {job.target_format.upper()}")
+        self.destination_label.configure(text=f"Destination: {job.output_folder}")
+        self._drawn_state = None
         self.update_display()
     
     def update_display(self):
         """Update the display based on job status."""
-        # Update status indicator
-        if self.job.status == ConversionStatus.PENDING:
-            self.status_label.configure(text="⏳", text_color="#fbbf24")
-        elif self.job.status == ConversionStatus.CONVERTING:
-            self.status_label.configure(text="��", text_color="#00d4ff")
-        elif self.job.status == ConversionStatus.COMPLETED:
-            self.status_label.configure(text="✅", text_color="#4ade80")
-        elif self.job.status == ConversionStatus.FAILED:
-            self.status_label.configure(text="❌", text_color="#f87171")
+        # Skip the widget reconfigures entirely when nothing visible has changed
+        state = (self.job.status, round(self.job.progress, 1))
+        if state == self._drawn_state:
+            return
+        status_changed = self._drawn_state is None or state[0] is not self._drawn_state[0]
+        self._drawn_state = state
+        
+        # Status indicator and button only change on a status transition;
+        # a progress tick just rewrites the status text and the bar
+        if status_changed:
+            style = _STATUS_STYLES.get(self.job.status)
+            if style is not None:
+                self.status_label.configure(text=style[0], text_color=style[1])
+            
+            if self.job.status in _CANCELLABLE_STATUSES:
+                self.cancel_button.configure(state="normal")
+            else:
+                self.cancel_button.configure(state="disabled")
         
         # Update status text
         status_text = self._get_status_text(self.job)
         self.status_text_label.configure(text=status_text)
         
         # Update progress
-        if hasattr(self.job, 'progress'):
-            self.progress_bar.set(self.job.progress / 100)
-        
-        # Update button visibility
-        if self.job.status in [ConversionStatus.CONVERTING, ConversionStatus.PENDING]:
-            self.cancel_button.configure(state="normal")
-        else:
-            self.cancel_button.configure(state="disabled")
+        self.progress_bar.set(self.job.progress / 100)
     
     def _get_status_text(self, job: ConversionJob) -> str:
         """Get status text for a job."""
-        if job.status == ConversionStatus.PENDING:
-            return "Pending"
-        elif job.status == ConversionStatus.CONVERTING:
-            progress = getattr(job, 'progress', 0)
-            return f"Converting {progress:.1f}%"
-        elif job.status == ConversionStatus.COMPLETED:
-            return "Completed"
-        elif job.status == ConversionStatus.FAILED:
-            return "Failed"
-        return "Unknown"
+        if job.status is ConversionStatus.CONVERTING:
+            return f"Converting {job.progress:.1f}%"
+        return _STATUS_TEXT.get(job.status, "Unknown")
 
 
 class ConversionQueueViewFrame(ctk.CTkFrame):
@@ -121,13 +163,17 @@ class ConversionQueueViewFrame(ctk.CTkFrame):
         self.cancel_job_callback = cancel_job_callback
         self.start_conversions_callback = start_conversions_callback
         self.remove_job_callback = None  # Will be set by main application
-        self.jobs: List[ConversionJob] = []
-        self.job_cards = {}  # job -> card mapping
-        self.converting_animation_counter = 0
-        self.converting_dots = ["", ".", "..", "..."]
+        # id(job) -> (job, card) in queue order; identity keys keep equal-looking jobs apart
+        self._entries: "OrderedDict[int, Tuple[ConversionJob, ConversionJobCard]]" = OrderedDict()
+        self._jobs_by_key = {}  # (input_path, target_format, output_folder) -> job, to spot duplicates
+        self._card_pool: List[ConversionJobCard] = []  # Hidden, removed cards ready for reuse
         self._create_widgets()
         self._layout_widgets()
-        self._start_animation()
+    
+    @property
+    def jobs(self) -> List[ConversionJob]:
+        """Jobs shown in the view, in queue order."""
+        return [job for job, _ in self._entries.values()]
     
     def _create_widgets(self):
         """Create all UI widgets."""
@@ -162,9 +208,6 @@ class ConversionQueueViewFrame(ctk.CTkFrame):
         
         # Scrollable frame for job cards
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
-        
-        # Progress bar frame (will be populated dynamically)
-        self.progress_frame = ctk.CTkFrame(self)
     
     def _layout_widgets(self):
         """Layout all widgets in the frame using grid for top alignment and visible queue."""
@@ -172,9 +215,19 @@ class ConversionQueueViewFrame(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.header_frame.grid(row=0, column=0, sticky="ew", padx=0, pady=(0, 8))
         self.scrollable_frame.grid(row=1, column=0, sticky="nsew")
+    
+    def contains(self, job: ConversionJob) -> bool:
+        """
+        Check whether an unfinished conversion of the same file, format and folder is already queued.
         
-        # Bind events
-        self.scrollable_frame.bind('<Button-3>', self._on_item_right_click)
+        Args:
+            job: The candidate job
+            
+        Returns:
+            True if a matching job is still pending or converting
+        """
+        existing = self._jobs_by_key.get((job.input_path, job.target_format, job.output_folder))
+        return existing is not None and existing.status in _CANCELLABLE_STATUSES
     
     def add_job(self, job: ConversionJob):
         """
@@ -183,14 +236,17 @@ class ConversionQueueViewFrame(ctk.CTkFrame):
         Args:
             job: The conversion job to add
         """
-        self.jobs.append(job)
-        
-        # Create job card
-        job_card = ConversionJobCard(self.scrollable_frame, job, self.cancel_job_callback)
+        # Reuse a hidden card when one is available, otherwise build a new one
+        if self._card_pool:
+            job_card = self._card_pool.pop()
+            job_card.set_job(job)
+        else:
+            job_card = ConversionJobCard(self.scrollable_frame, job, self.cancel_job_callback)
         job_card.pack(fill="x", padx=10, pady=5)
         
         # Store mapping
-        self.job_cards[job] = job_card
+        self._entries[id(job)] = (job, job_card)
+        self._jobs_by_key[(job.input_path, job.target_format, job.output_folder)] = job
         
         # Update status
         self._update_status()
@@ -205,8 +261,9 @@ class ConversionQueueViewFrame(ctk.CTkFrame):
         Args:
             job: The job to update
         """
-        if job in self.job_cards:
-            self.job_cards[job].update_display()
+        entry = self._entries.get(id(job))
+        if entry is not None:
+            entry[1].update_display()
     
     def remove_job(self, job: ConversionJob):
         """
@@ -215,58 +272,89 @@ class ConversionQueueViewFrame(ctk.CTkFrame):
         Args:
             job: The job to remove
         """
-        if job in self.job_cards:
-            self.job_cards[job].destroy()
-            del self.job_cards[job]
-        if job in self.jobs:
-            self.jobs.remove(job)
+        entry = self._entries.pop(id(job), None)
+        if entry is not None:
+            self._release_card(entry[1])
+            self._forget_key(job)
         self._update_status()
     
+    def _forget_key(self, job: ConversionJob):
+        """Drop the duplicate-check entry for a job that left the view."""
+        key = (job.input_path, job.target_format, job.output_folder)
+        if self._jobs_by_key.get(key) is job:
+            del self._jobs_by_key[key]
+    
+    def _release_card(self, card: ConversionJobCard):
+        """Hide a card that no longer shows a job, keeping it for reuse if the pool has room."""
+        if len(self._card_pool) < _CARD_POOL_SIZE:
+            card.pack_forget()
+            self._card_pool.append(card)
+        else:
+            card.destroy()
+    
     def _update_status(self):
         """Update the status display."""
-        total_jobs = len(self.jobs)
-        completed_jobs = len([j for j in self.jobs if j.status == ConversionStatus.COMPLETED])
-        failed_jobs = len([j for j in self.jobs if j.status == ConversionStatus.FAILED])
-        active_jobs = len([j for j in self.jobs if j.status == ConversionStatus.CONVERTING])
+        # The summary only feeds a debug log, so skip counting when it would be dropped
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         
-        status_text = f"Total: {total_jobs} | Active: {active_jobs} | Completed: {completed_jobs} | Failed: {failed_jobs}"
-        print(f"[DEBUG] Conversion queue status: {status_text}")
+        # Count every status in a single pass
+        total_jobs = len(self._entries)
+        completed_jobs = failed_jobs = active_jobs = 0
+        for job, _ in self._entries.values():
+            status = job.status
+            if status is ConversionStatus.CONVERTING:
+                active_jobs += 1
+            elif status is ConversionStatus.COMPLETED:
+                completed_jobs += 1
+            elif status is ConversionStatus.FAILED:
+                failed_jobs += 1
+        
+        log.debug("Conversion queue status: Total: %d | Active: %d | Completed: %d | Failed: %d",
+                  total_jobs, active_jobs, completed_jobs, failed_jobs)
     
     def _clear_jobs(self):
         """Clear all jobs from the queue."""
-        if not self.jobs:
+        if not self._entries:
             return
         
         result = messagebox.askyesno("Clear All Jobs", "Are you sure you want to clear all conversion jobs from the queue?")
         if result:
-            # Cancel all active jobs
-            for job in self.jobs:
-                if job.status in [ConversionStatus.PENDING, ConversionStatus.CONVERTING]:
-                    self.cancel_job_callback(job)
+            # Cancel all active jobs and clear all job cards, with the list hidden
+            # so it is not repainted once per removed card
+            self.scrollable_frame.grid_remove()
+            try:
+                for job, card in self._entries.values():
+                    if job.status in _CANCELLABLE_STATUSES:
+                        self.cancel_job_callback(job)
+                    self._release_card(card)
+            finally:
+                self.scrollable_frame.grid()
             
-            # Clear all job cards
-            for card in self.job_cards.values():
-                card.destroy()
-            
-            self.job_cards.clear()
-            self.jobs.clear()
+            self._entries.clear()
+            self._jobs_by_key.clear()
             self._update_status()
     
     def _clear_completed_jobs(self):
         """Clear completed jobs from the queue."""
-        completed_jobs = [j for j in self.jobs if j.status == ConversionStatus.COMPLETED]
-        if not completed_jobs:
+        completed_ids = [key for key, (job, _) in self._entries.items() if job.status is ConversionStatus.COMPLETED]
+        if not completed_ids:
             return
         
-        result = messagebox.askyesno("Clear Completed Jobs", f"Are you sure you want to clear {len(completed_jobs)} completed conversion jobs?")
+        result = messagebox.askyesno("Clear Completed Jobs", f"Are you sure you want to clear {len(completed_ids)} completed conversion jobs?")
         if result:
-            for job in completed_jobs:
-                self.remove_job(job)
-    
-    def _on_item_right_click(self, event):
-        """Handle right-click on items."""
-        # For now, we'll implement a simple context menu
-        pass
+            # Release every card with the list hidden, then refresh the status
+            # and lay the list out once for the whole batch
+            self.scrollable_frame.grid_remove()
+            try:
+                for key in completed_ids:
+                    job, card = self._entries.pop(key)
+                    self._release_card(card)
+                    self._forget_key(job)
+            finally:
+                self.scrollable_frame.grid()
+            self._update_status()
+            self.scrollable_frame.update_idletasks()
     
     def _on_item_double_click(self, event):
         """Handle double-click on items."""
@@ -280,29 +368,10 @@ class ConversionQueueViewFrame(ctk.CTkFrame):
     
     def _retry_job(self, job: ConversionJob):
         """Retry a failed job."""
-        if job.status == ConversionStatus.FAILED:
+        if job.status in _RETRIABLE_STATUSES:
             job.status = ConversionStatus.PENDING
             self.update_job(job)
     
-    def _start_animation(self):
-        """Start the converting animation."""
-        def animate():
-            if self.converting_animation_counter < len(self.converting_dots) - 1:
-                self.converting_animation_counter += 1
-            else:
-                self.converting_animation_counter = 0
-            
-            # Update all converting jobs
-            for job in self.jobs:
-                if job.status == ConversionStatus.CONVERTING:
-                    self.update_job(job)
-            
-            # Schedule next animation frame
-            self.after(500, animate)
-        
-        # Start animation
-        self.after(500, animate)
-    
     def set_remove_job_callback(self, callback: Callable[[ConversionJob], None]):
         """Set the callback for removing jobs."""
         self.remove_job_callback = callback
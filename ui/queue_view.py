@@ -8,8 +8,24 @@ from tkinter import messagebox, simpledialog
 from typing import List, Callable, Optional
 import threading
 import os
+import logging
+from collections import Counter
 
-from core.queue import DownloadJob, JobStatus
+from core.queue import DownloadJob, JobStatus, JobUIState
+
+log = logging.getLogger("bgd.ui")
+
+# Jobs in these states can still be cancelled
+_CANCELLABLE_STATUSES = frozenset({JobStatus.PENDING, JobStatus.DOWNLOADING})
+# Jobs in these states can be put back in the queue
+_RETRIABLE_STATUSES = frozenset({JobStatus.FAILED})
+
+# Fixed status text; only DOWNLOADING is formatted per update
+_STATUS_TEXT = {
+    JobStatus.PENDING: "Pending",
+    JobStatus.COMPLETED: "Completed",
+    JobStatus.FAILED: "Failed",
+}
 
 
 class JobCard(ctk.CTkFrame):
@@ -19,6 +35,7 @@ class JobCard(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         self.job = job
         self.cancel_callback = cancel_callback
+        self._drawn_state: Optional[JobUIState] = None  # Last rendered state, to skip no-op redraws
         
         # Create layout
         self.grid_columnconfigure(1, weight=1)
@@ -66,45 +83,51 @@ class JobCard(ctk.CTkFrame):
         
         self.update_display()
     
-    def update_display(self):
-        """Update the display based on job status."""
+    def update_display(self, state: Optional[JobUIState] = None):
+        """
+        Update the display based on job status.
+        
+        Args:
+            state: State to draw; the job's last published state if omitted
+        """
+        # Draw from one published snapshot so status, progress and speed always agree;
+        # the live fields are only read when nothing has been published yet
+        if state is None:
+            state = self.job.ui_state or self.job.publish_ui_state()
+        
+        # Repeated refreshes often find nothing new to draw
+        if state == self._drawn_state:
+            return
+        self._drawn_state = state
+        
         # Update status indicator
-        if self.job.status == JobStatus.PENDING:
+        if state.status == JobStatus.PENDING:
             self.status_label.configure(text="⏳", text_color="#fbbf24")
-        elif self.job.status == JobStatus.DOWNLOADING:
+        elif state.status == JobStatus.DOWNLOADING:
             self.status_label.configure(text="⬇️", text_color="#00d4ff")
-        elif self.job.status == JobStatus.COMPLETED:
+        elif state.status == JobStatus.COMPLETED:
             self.status_label.configure(text="✅", text_color="#4ade80")
-        elif self.job.status == JobStatus.FAILED:
+        elif state.status == JobStatus.FAILED:
             self.status_label.configure(text="❌", text_color="#f87171")
         
         # Update status text
-        status_text = self._get_status_text(self.job)
+        status_text = self._get_status_text(state)
         self.status_text_label.configure(text=status_text)
         
         # Update progress
-        if hasattr(self.job, 'progress'):
-            self.progress_bar.set(self.job.progress / 100)
+        self.progress_bar.set(state.progress / 100)
         
         # Update button visibility
-        if self.job.status in [JobStatus.DOWNLOADING, JobStatus.PENDING]:
+        if state.status in _CANCELLABLE_STATUSES:
             self.cancel_button.configure(state="normal")
         else:
             self.cancel_button.configure(state="disabled")
     
-    def _get_status_text(self, job: DownloadJob) -> str:
-        """Get status text for a job."""
-        if job.status == JobStatus.PENDING:
-            return "Pending"
-        elif job.status == JobStatus.DOWNLOADING:
-            progress = getattr(job, 'progress', 0)
-            speed = getattr(job, 'speed', 'N/A')
-            return f"Downloading {progress:.1f}% - {speed}"
-        elif job.status == JobStatus.COMPLETED:
-            return "Completed"
-        elif job.status == JobStatus.FAILED:
-            return "Failed"
-        return "Unknown"
+    def _get_status_text(self, state: JobUIState) -> str:
+        """Get status text for a job state."""
+        if state.status is JobStatus.DOWNLOADING:
+            return f"Downloading {state.progress:.1f}% - {state.speed}"
+        return _STATUS_TEXT.get(state.status, "Unknown")
 
 
 class QueueViewFrame(ctk.CTkFrame):
@@ -127,11 +150,9 @@ class QueueViewFrame(ctk.CTkFrame):
         self.remove_job_callback = None  # Will be set by main application
         self.jobs: List[DownloadJob] = []
         self.job_cards = {}  # job -> card mapping
-        self.downloading_animation_counter = 0
-        self.downloading_dots = ["", ".", "..", "..."]
+        self._jobs_by_key = {}  # job.dedupe_key -> job, to spot duplicates
         self._create_widgets()
         self._layout_widgets()
-        self._start_animation()
     
     def _create_widgets(self):
         """Create all UI widgets."""
@@ -166,9 +187,6 @@ class QueueViewFrame(ctk.CTkFrame):
         
         # Scrollable frame for job cards
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
-        
-        # Progress bar frame (will be populated dynamically)
-        self.progress_frame = ctk.CTkFrame(self)
     
     def _layout_widgets(self):
         """Layout all widgets in the frame using grid for top alignment and visible queue."""
@@ -178,9 +196,20 @@ class QueueViewFrame(ctk.CTkFrame):
         self.header_frame.grid(row=0, column=0, sticky="ew", padx=0, pady=(0, 8))
         self.scrollable_frame.grid(row=1, column=0, sticky="nsew")
         print("Scrollable frame created and gridded.")
+    
+    def contains(self, job: DownloadJob) -> bool:
+        """
+        Check whether an unfinished job for the same URL, format, folder and
+        compatibility mode is already queued.
         
-        # Bind events
-        self.scrollable_frame.bind('<Button-3>', self._on_item_right_click)
+        Args:
+            job: The candidate job
+            
+        Returns:
+            True if a matching job is still pending or downloading
+        """
+        existing = self._jobs_by_key.get(job.dedupe_key)
+        return existing is not None and existing.status in _CANCELLABLE_STATUSES
     
     def add_job(self, job: DownloadJob):
         """
@@ -189,7 +218,41 @@ class QueueViewFrame(ctk.CTkFrame):
         Args:
             job: The download job to add
         """
+        job_card = self._add_card(job)
+        
+        # Update status
+        self._update_status()
+        
+        # Select the new item
+        job_card.focus_set()
+    
+    def add_jobs(self, jobs: List[DownloadJob]):
+        """
+        Add several jobs at once, e.g. a playlist.
+        
+        The list is hidden while the cards are built so it is laid out once
+        for the whole batch instead of once per card.
+        
+        Args:
+            jobs: The download jobs to add, in queue order
+        """
+        if not jobs:
+            return
+        
+        self.scrollable_frame.grid_remove()
+        try:
+            for job in jobs:
+                job_card = self._add_card(job)
+        finally:
+            self.scrollable_frame.grid()
+        
+        self._update_status()
+        job_card.focus_set()
+    
+    def _add_card(self, job: DownloadJob) -> JobCard:
+        """Create, pack and register the card for a job."""
         self.jobs.append(job)
+        self._jobs_by_key[job.dedupe_key] = job
         
         # Create job card
         job_card = JobCard(self.scrollable_frame, job, self.cancel_job_callback)
@@ -197,22 +260,18 @@ class QueueViewFrame(ctk.CTkFrame):
         
         # Store mapping
         self.job_cards[job] = job_card
-        
-        # Update status
-        self._update_status()
-        
-        # Select the new item
-        job_card.focus_set()
+        return job_card
     
-    def update_job(self, job: DownloadJob):
+    def update_job(self, job: DownloadJob, state: Optional[JobUIState] = None):
         """
         Update a job's display in the queue view.
         
         Args:
             job: The job to update
+            state: Published state to draw; the job's last published state if omitted
         """
         if job in self.job_cards:
-            self.job_cards[job].update_display()
+            self.job_cards[job].update_display(state)
     
     def remove_job(self, job: DownloadJob):
         """
@@ -226,8 +285,15 @@ class QueueViewFrame(ctk.CTkFrame):
             del self.job_cards[job]
         if job in self.jobs:
             self.jobs.remove(job)
+        self._forget_key(job)
         self._update_status()
     
+    def _forget_key(self, job: DownloadJob):
+        """Drop the duplicate-check entry for a job that left the view."""
+        key = job.dedupe_key
+        if self._jobs_by_key.get(key) is job:
+            del self._jobs_by_key[key]
+    
     def _cleanup_orphaned_widgets(self):
         """Clean up any orphaned job_widgets entries."""
         orphaned_jobs = []
@@ -245,13 +311,15 @@ class QueueViewFrame(ctk.CTkFrame):
     
     def _update_status(self):
         """Update the status display."""
-        total_jobs = len(self.jobs)
-        completed_jobs = len([j for j in self.jobs if j.status == JobStatus.COMPLETED])
-        failed_jobs = len([j for j in self.jobs if j.status == JobStatus.FAILED])
-        active_jobs = len([j for j in self.jobs if j.status == JobStatus.DOWNLOADING])
+        # The summary only feeds a debug log, so skip counting when it would be dropped
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         
-        status_text = f"Total: {total_jobs} | Active: {active_jobs} | Completed: {completed_jobs} | Failed: {failed_jobs}"
-        print(f"[DEBUG] Queue status: {status_text}")
+        # Count every status in a single pass
+        counts = Counter(job.status for job in self.jobs)
+        log.debug("Queue status: Total: %d | Active: %d | Completed: %d | Failed: %d",
+                  len(self.jobs), counts[JobStatus.DOWNLOADING], counts[JobStatus.COMPLETED],
+                  counts[JobStatus.FAILED])
     
     def _clear_jobs(self):
         """Clear all jobs from the queue."""
@@ -262,32 +330,45 @@ class QueueViewFrame(ctk.CTkFrame):
         if result:
             # Cancel all active jobs
             for job in self.jobs:
-                if job.status in [JobStatus.PENDING, JobStatus.DOWNLOADING]:
+                if job.status in _CANCELLABLE_STATUSES:
                     self.cancel_job_callback(job)
             
-            # Clear all job cards
-            for card in self.job_cards.values():
-                card.destroy()
+            # Clear all job cards, with the list hidden so it is not repainted per card
+            self.scrollable_frame.grid_remove()
+            try:
+                for card in self.job_cards.values():
+                    card.destroy()
+            finally:
+                self.scrollable_frame.grid()
             
             self.job_cards.clear()
             self.jobs.clear()
+            self._jobs_by_key.clear()
             self._update_status()
     
     def _clear_completed_jobs(self):
         """Clear completed jobs from the queue."""
-        completed_jobs = [j for j in self.jobs if j.status == JobStatus.COMPLETED]
+        completed_jobs = [j for j in self.jobs if j.status is JobStatus.COMPLETED]
         if not completed_jobs:
             return
         
         result = messagebox.askyesno("Clear Completed Jobs", f"Are you sure you want to clear {len(completed_jobs)} completed jobs?")
         if result:
-            for job in completed_jobs:
-                self.remove_job(job)
-    
-    def _on_item_right_click(self, event):
-        """Handle right-click on items."""
-        # For now, we'll implement a simple context menu
-        pass
+            # Destroy every card with the list hidden, then rebuild the job list and
+            # refresh the status once instead of per job
+            self.scrollable_frame.grid_remove()
+            try:
+                for job in completed_jobs:
+                    card = self.job_cards.pop(job, None)
+                    if card is not None:
+                        card.destroy()
+                    self._forget_key(job)
+            finally:
+                self.scrollable_frame.grid()
+            
+            completed_ids = {id(job) for job in completed_jobs}
+            self.jobs[:] = [job for job in self.jobs if id(job) not in completed_ids]
+            self._update_status()
     
     def _get_job_by_item_id(self, item_id: str) -> Optional[DownloadJob]:
         """Get job by treeview item ID."""
@@ -296,28 +377,9 @@ class QueueViewFrame(ctk.CTkFrame):
     
     def _retry_job(self, job: DownloadJob):
         """Retry a failed job."""
-        if job.status == JobStatus.FAILED:
+        if job.status in _RETRIABLE_STATUSES:
             job.status = JobStatus.PENDING
-            self.update_job(job)
-    
-    def _start_animation(self):
-        """Start the downloading animation."""
-        def animate():
-            if self.downloading_animation_counter < len(self.downloading_dots) - 1:
-                self.downloading_animation_counter += 1
-            else:
-                self.downloading_animation_counter = 0
-            
-            # Update all downloading jobs
-            for job in self.jobs:
-                if job.status == JobStatus.DOWNLOADING:
-                    self.update_job(job)
-            
-            # Schedule next animation frame
-            self.after(500, animate)
-        
-        # Start animation
-        self.after(500, animate)
+            self.update_job(job, job.publish_ui_state())
     
     def set_remove_job_callback(self, callback: Callable[[DownloadJob], None]):
         """Set the callback for removing jobs."""
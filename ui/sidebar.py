@@ -5,7 +5,7 @@ Contains link entry, format selection, and add-to-queue functionality.
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox, scrolledtext
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 import os
 import subprocess
 import json
@@ -20,7 +20,8 @@ from core.utils import (
     check_system_resources, safe_error_message, _find_yt_dlp,
     is_adult_content_site
 )
-from core.queue import DownloadJob
+from core.queue import DownloadJob, AddJobsResult
+from core.conversion_queue import AddResult
 
 # CustomTkinter Switch (replaces ToggleSwitch)
 class ModernSwitch(ctk.CTkSwitch):
@@ -119,15 +120,16 @@ class SidebarFrame(ctk.CTkFrame):
     Sidebar frame containing input controls and format selection.
     """
     
-    def __init__(self, parent, add_job_callback: Callable[[DownloadJob], None], 
+    def __init__(self, parent, add_job_callback: Callable[[DownloadJob], Optional[AddJobsResult]], 
                  output_folder: str = "", folder_change_callback: Optional[Callable[[str], None]] = None,
-                 add_conversion_job_callback: Optional[Callable[[str, str, str], None]] = None):
+                 add_conversion_job_callback: Optional[Callable[[str, str, str], Optional[AddResult]]] = None):
         try:
             super().__init__(parent, width=320)  # Increased width for better proportions
             self.add_job_callback = add_job_callback
             self.folder_change_callback = folder_change_callback
             self.add_conversion_job_callback = add_conversion_job_callback
             self.update_callback = None
+            self.add_jobs_callback = None  # Optional bulk variant of add_job_callback
             self.output_folder = output_folder or os.path.expanduser("~/Downloads")
             self.selected_file_path = ""
             self.current_mode = "youtube"  # Default to YouTube mode
@@ -236,25 +238,57 @@ class SidebarFrame(ctk.CTkFrame):
             if count == 1:
                 videos = videos[:1]
             
-            # Create and add job(s) for each individual video
-            for video in videos:
-                # Use the individual video URL from the playlist
-                # The get_playlist_videos function already handles CDN URL issues
-                job = DownloadJob(
-                    url=video['url'],  # Use individual video URL from playlist
+            # Create a job for each individual video
+            compatibility_mode = bool(self.compatibility_toggle.get())
+            jobs = [
+                DownloadJob(
+                    # Use the individual video URL from the playlist
+                    # The get_playlist_videos function already handles CDN URL issues
+                    url=video['url'],
                     format=format_type,
                     output_folder=output_folder,
                     mode=platform,
-                    compatibility_mode=bool(self.compatibility_toggle.get()),
+                    compatibility_mode=compatibility_mode,
                     title=video['title']
                 )
-                self.add_job_callback(job)
+                for video in videos
+            ]
+            
+            # Hand the whole batch over at once when the app supports it.
+            # Callbacks report what happened to the jobs; None means all were queued.
+            if self.add_jobs_callback:
+                result = self.add_jobs_callback(jobs)
+            else:
+                results = [self.add_job_callback(job) for job in jobs]
+                result = None if None in results else AddJobsResult(
+                    sum(r.added for r in results),
+                    sum(r.duplicates for r in results),
+                    sum(r.rejected for r in results),
+                )
+            if result is None:
+                result = AddJobsResult(added=len(jobs))
             
             # Show status message
-            if len(videos) == 1:
-                self._show_status("Added to queue")
+            if result.added == len(jobs):
+                if len(videos) == 1:
+                    self._show_status("Added to queue")
+                else:
+                    self._show_status(f"Added {len(videos)} videos to queue")
+            elif result.duplicates == len(jobs):
+                if len(videos) == 1:
+                    self._show_status("Already in queue", error=True)
+                else:
+                    self._show_status("All of these videos are already in queue", error=True)
+            elif len(jobs) == 1:
+                # Rejected; the app has already explained why in a dialog
+                self._show_status("Not added to queue", error=True)
             else:
-                self._show_status(f"Added {len(videos)} videos to queue")
+                message = f"Added {result.added} of {len(jobs)} videos to queue"
+                if result.duplicates:
+                    message += f", {result.duplicates} already queued"
+                if result.rejected:
+                    message += f", {result.rejected} not added"
+                self._show_status(message, error=result.added == 0)
             
             self.url_entry.delete(0, "end")
                 
@@ -417,7 +451,14 @@ class SidebarFrame(ctk.CTkFrame):
             return
         if self.add_conversion_job_callback:
             try:
-                self.add_conversion_job_callback(self.selected_file_path, target_format, output_folder)
+                result = self.add_conversion_job_callback(self.selected_file_path, target_format, output_folder)
+                if result is AddResult.DUPLICATE:
+                    self._show_conversion_status('This file is already in the conversion queue', error=True)
+                    return
+                if result is AddResult.REJECTED:
+                    # The app has already explained why in a dialog
+                    self._show_conversion_status('Conversion job was not added', error=True)
+                    return
                 self._show_conversion_status('Conversion job added to queue')
                 self.selected_file_path = ""
                 self.file_path_var.set("No file selected")
@@ -470,6 +511,10 @@ class SidebarFrame(ctk.CTkFrame):
         """Set the callback for the update button."""
         self.update_callback = callback
     
+    def set_add_jobs_callback(self, callback: Callable[[List[DownloadJob]], Optional[AddJobsResult]]):
+        """Set the callback used to queue several jobs (e.g. a playlist) in one call."""
+        self.add_jobs_callback = callback
+    
     def _show_status(self, message: str, error: bool = False):
         """Show status message with appropriate styling."""
         if error: